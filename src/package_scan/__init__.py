@@ -4,14 +4,26 @@ Multi-Ecosystem Package Threat Scanner
 Scans for compromised packages across npm, Maven/Gradle, Python, and Ruby ecosystems
 """
 
-try:
-    from importlib.metadata import version
-    __version__ = version("package-scan")
-except Exception:
-    # Fallback for development installs
-    __version__ = "0.0.0-dev"
+__all__ = ['core', 'adapters', '__version__']
 
-from . import adapters
-from . import core
 
-__all__ = ['core', 'adapters', '__version__']
+def _resolve_version() -> str:
+    """Look up the installed distribution version (importlib.metadata is slow to import)"""
+    try:
+        from importlib.metadata import version
+        return version("package-scan")
+    except Exception:
+        # Fallback for development installs
+        return "0.0.0-dev"
+
+
+def __getattr__(name):
+    """Import subpackages on first access so CLI startup stays light (PEP 562)"""
+    if name in ('adapters', 'core'):
+        from importlib import import_module
+        return import_module(f'.{name}', __name__)
+    if name == '__version__':
+        global __version__
+        __version__ = _resolve_version()
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
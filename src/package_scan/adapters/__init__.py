@@ -1,5 +1,7 @@
 """Ecosystem-specific scanning adapters"""
 
+from functools import lru_cache
+
 from .base import EcosystemAdapter
 from .java_adapter import JavaAdapter
 from .npm_adapter import NpmAdapter
@@ -34,11 +36,14 @@ def get_adapter_class(ecosystem: str):
     return ADAPTER_REGISTRY.get(ecosystem.lower())
 
 
+@lru_cache(maxsize=1)
 def get_available_ecosystems():
     """
-    Get list of ecosystems with implemented adapters
+    Get ecosystems with implemented adapters
+
+    The registry is static, so the result is computed once and cached.
 
     Returns:
-        List of ecosystem names
+        Tuple of ecosystem names
     """
-    return list(ADAPTER_REGISTRY.keys())
+    return tuple(ADAPTER_REGISTRY.keys())
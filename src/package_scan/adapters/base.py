@@ -1,24 +1,64 @@
 """Base adapter interface for ecosystem-specific scanners"""
 
+import os
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple, Union
 
 import click
 
 from package_scan.core import Finding, ThreatDatabase
 
 
+# Directories that never contain project source (checked once per directory walked)
+SKIP_DIRS = frozenset({
+    'node_modules',
+    '.git',
+    '.svn',
+    '.hg',
+    '__pycache__',
+    '.pytest_cache',
+    '.tox',
+    'venv',
+    'env',
+    '.venv',
+    '.env',
+    'build',
+    'dist',
+    'target',  # Maven/Gradle
+    '.gradle',
+    '.m2',
+    'vendor',  # Ruby
+    '.bundle',
+    'site-packages',
+    '.eggs',
+    '*.egg-info',
+})
+
+# Upper bound on threads used to scan projects. Project scans are dominated
+# by file reads, so allow more threads than cores. When several ecosystems
+# are scanned at once they share one pool of this size.
+MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
 class ProgressSpinner:
     """Simple spinner for showing scan progress that updates in place"""
 
+    # Minimum seconds between in-place redraws (20 per second)
+    MIN_REDRAW_INTERVAL = 0.05
+
     def __init__(self, enabled: bool = True):
         self.frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self.current_frame = 0
         self.is_tty = sys.stdout.isatty()
         self.enabled = enabled
         self.last_line_length = 0
+        self._last_redraw = 0.0
+        self._redraw_lock = threading.Lock()
 
     def update(self, message: str):
         """Update the spinner with a new message"""
@@ -30,6 +70,24 @@ class ProgressSpinner:
             click.echo(f"  {message}")
             return
 
+        # Redrawing faster than the eye can follow only costs terminal writes.
+        # Project scans (e.g. npm node_modules walks) report progress from
+        # scan worker threads; skip this update if another thread is
+        # mid-redraw rather than wait for it.
+        now = time.monotonic()
+        if now - self._last_redraw < self.MIN_REDRAW_INTERVAL:
+            return
+        if not self._redraw_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._last_redraw = now
+            self._redraw(message)
+        finally:
+            self._redraw_lock.release()
+
+    def _redraw(self, message: str):
+        """Draw the next spinner frame with the given message in place"""
         # In TTY mode, show animated spinner with overwriting
         spinner = self.frames[self.current_frame % len(self.frames)]
         self.current_frame += 1
@@ -89,6 +147,13 @@ class EcosystemAdapter(ABC):
         self.ecosystem_name = self._get_ecosystem_name()
         self.spinner = spinner or ProgressSpinner(enabled=False)
 
+        # Console messages are collected here instead of printed while a
+        # buffered scan runs (see scan_all_projects_buffered)
+        self._output: Optional[List[Tuple[str, bool]]] = None
+        # Per-thread message list for the project being scanned, so worker
+        # threads never print (see _scan_project_safely)
+        self._project_output = threading.local()
+
         # Get compromised packages for this ecosystem
         self.compromised_packages = threat_db.get_all_packages(self.ecosystem_name)
 
@@ -133,8 +198,9 @@ class EcosystemAdapter(ABC):
         """
         pass
 
+    @classmethod
     @abstractmethod
-    def get_manifest_files(self) -> List[str]:
+    def get_manifest_files(cls) -> List[str]:
         """
         Return list of manifest file names for this ecosystem
 
@@ -143,8 +209,9 @@ class EcosystemAdapter(ABC):
         """
         pass
 
+    @classmethod
     @abstractmethod
-    def get_lockfile_names(self) -> List[str]:
+    def get_lockfile_names(cls) -> List[str]:
         """
         Return list of lockfile names for this ecosystem
 
@@ -153,10 +220,15 @@ class EcosystemAdapter(ABC):
         """
         pass
 
-    def scan_all_projects(self) -> List[Finding]:
+    def scan_all_projects(self, executor: Optional[Executor] = None) -> List[Finding]:
         """
         Scan all detected projects in the root directory
 
+        Args:
+            executor: Optional shared executor to scan projects on. When
+                omitted, a pool of up to MAX_SCAN_WORKERS threads is created
+                for this scan.
+
         Returns:
             List of all findings across all projects
         """
@@ -168,30 +240,111 @@ class EcosystemAdapter(ABC):
         if not projects:
             return all_findings
 
-        click.echo(click.style(
+        self._echo(click.style(
             f"\n🔍 Scanning {self.ecosystem_name} ecosystem: found {len(projects)} project(s)",
             fg='cyan', bold=True))
 
-        # Scan each project
-        for idx, project_dir in enumerate(projects, 1):
-            self.spinner.update(f"[{idx}/{len(projects)}] Scanning {project_dir}")
+        # Projects are independent, so overlap their file I/O on a thread
+        # pool. Results and their messages come back in project order and
+        # are merged and printed here.
+        own_executor = None
+        if len(projects) > 1 and executor is None and MAX_SCAN_WORKERS > 1:
+            executor = own_executor = ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(projects)))
 
-            try:
-                findings = self.scan_project(project_dir)
-                all_findings.extend(findings)
-            except Exception as e:
-                click.echo(click.style(
-                    f"\n⚠️  Warning: Error scanning {project_dir}: {e}",
-                    fg='yellow'), err=True)
+        if len(projects) > 1 and executor is not None:
+            results = executor.map(self._scan_project_safely, projects)
+        else:
+            results = map(self._scan_project_safely, projects)
+
+        try:
+            for idx, (project_dir, outcome, messages) in enumerate(results, 1):
+                for message, err in messages:
+                    self._echo(message, err=err)
+
+                self.spinner.update(f"[{idx}/{len(projects)}] Scanned {project_dir}")
+
+                if isinstance(outcome, Exception):
+                    self._echo(click.style(
+                        f"\n⚠️  Warning: Error scanning {project_dir}: {outcome}",
+                        fg='yellow'), err=True)
+                else:
+                    all_findings.extend(outcome)
+        finally:
+            if own_executor is not None:
+                own_executor.shutdown()
 
         self.spinner.clear()
 
-        click.echo(click.style(
+        self._echo(click.style(
             f"✓ {self.ecosystem_name}: scanned {len(projects)} project(s), found {len(all_findings)} issue(s)",
             fg='green'))
 
         return all_findings
 
+    def scan_all_projects_buffered(
+        self, executor: Optional[Executor] = None
+    ) -> Tuple[List[Finding], List[Tuple[str, bool]]]:
+        """
+        Scan all detected projects, collecting console output instead of printing it
+
+        Used when several adapters scan concurrently, so each ecosystem's
+        messages can be printed as one block on the calling thread. Messages
+        are in the same order a direct scan_all_projects call prints them:
+        header, then each project's warnings in detection order, then summary.
+
+        Args:
+            executor: Optional shared executor to scan projects on
+
+        Returns:
+            Tuple of (findings, list of (message, err) pairs for click.echo)
+        """
+        output = self._output = []
+        try:
+            return self.scan_all_projects(executor), output
+        finally:
+            self._output = None
+
+    def _echo(self, message: str, err: bool = False):
+        """
+        Print a console message, or collect it during a project or buffered scan
+
+        Args:
+            message: Message to print
+            err: Whether the message goes to stderr
+        """
+        output = getattr(self._project_output, 'messages', None)
+        if output is None:
+            output = self._output
+
+        if output is not None:
+            output.append((message, err))
+        else:
+            click.echo(message, err=err)
+
+    def _scan_project_safely(
+        self, project_dir: Path
+    ) -> Tuple[Path, Union[List[Finding], Exception], List[Tuple[str, bool]]]:
+        """
+        Scan a project, capturing any error and console output instead of raising or printing
+
+        Runs on worker threads, so errors and messages are handed back to
+        the caller to be reported in project order.
+
+        Args:
+            project_dir: Project directory to scan
+
+        Returns:
+            Tuple of (project_dir, findings or the exception raised,
+            list of (message, err) pairs the scan would have printed)
+        """
+        messages = self._project_output.messages = []
+        try:
+            return project_dir, self.scan_project(project_dir), messages
+        except Exception as e:
+            return project_dir, e, messages
+        finally:
+            self._project_output.messages = None
+
     def _should_skip_directory(self, dir_path: Path) -> bool:
         """
         Check if directory should be skipped during scanning
@@ -205,36 +358,23 @@ class EcosystemAdapter(ABC):
         Returns:
             True if should skip, False otherwise
         """
-        skip_dirs = {
-            'node_modules',
-            '.git',
-            '.svn',
-            '.hg',
-            '__pycache__',
-            '.pytest_cache',
-            '.tox',
-            'venv',
-            'env',
-            '.venv',
-            '.env',
-            'build',
-            'dist',
-            'target',  # Maven/Gradle
-            '.gradle',
-            '.m2',
-            'vendor',  # Ruby
-            '.bundle',
-            'site-packages',
-            '.eggs',
-            '*.egg-info',
-        }
-
-        # Check if the directory name matches any skip patterns
-        dir_name = dir_path.name
-        if dir_name in skip_dirs or dir_name.startswith('.'):
-            return True
-
-        return False
+        return self._should_skip_dir_name(dir_path.name)
+
+    @staticmethod
+    def _should_skip_dir_name(dir_name: str) -> bool:
+        """
+        Check if a directory name should be skipped during scanning
+
+        Name-only variant of _should_skip_directory for directory walks,
+        which avoids building a Path for every subdirectory visited.
+
+        Args:
+            dir_name: Directory name (no parent path)
+
+        Returns:
+            True if should skip, False otherwise
+        """
+        return dir_name in SKIP_DIRS or dir_name.startswith('.')
 
     def _next_patch_version(self, version_str: str) -> str:
         """
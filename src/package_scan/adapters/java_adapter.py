@@ -12,6 +12,24 @@ from package_scan.core import Finding
 from .base import EcosystemAdapter
 
 
+# Gradle dependency declarations in either supported format, matched in a
+# single pass over the build file:
+#   string literal (groups 1-3): implementation 'group:artifact:version'
+#                                or implementation("group:artifact:version")
+#   map (groups 4-6): implementation group: 'group', name: 'artifact', version: 'version'
+_GRADLE_DEPENDENCY_PATTERN = re.compile(
+    r'''(?:implementation|compile|api|runtimeOnly|compileOnly|testImplementation|testCompile)'''
+    r'''(?:\s*[(\s]*['"]([\w\.\-]+):([\w\.\-]+):([\w\.\-\+]+)['"]'''
+    r'''|\s+group:\s*['"]([^'"]+)['"],\s*name:\s*['"]([^'"]+)['"],\s*version:\s*['"]([^'"]+)['"])''')
+
+# gradle.lockfile entry: group:artifact:version=classpath,config1,config2
+_GRADLE_LOCKFILE_PATTERN = re.compile(r'^([\w\.\-]+):([\w\.\-]+):([\w\.\-]+)=')
+
+# Maven version range such as [1.0,2.0) and its bounds
+_MAVEN_RANGE_PATTERN = re.compile(r'^[\[\(].*[\]\)]$')
+_MAVEN_RANGE_BOUNDS_PATTERN = re.compile(r'^([\[\(])(.*?),(.*?)([\]\)])$')
+
+
 class JavaAdapter(EcosystemAdapter):
     """
     Adapter for scanning Java/Maven/Gradle projects
@@ -29,11 +47,13 @@ class JavaAdapter(EcosystemAdapter):
         """Return ecosystem identifier"""
         return 'maven'
 
-    def get_manifest_files(self) -> List[str]:
+    @classmethod
+    def get_manifest_files(cls) -> List[str]:
         """Return list of manifest file names"""
         return ['pom.xml', 'build.gradle', 'build.gradle.kts']
 
-    def get_lockfile_names(self) -> List[str]:
+    @classmethod
+    def get_lockfile_names(cls) -> List[str]:
         """Return list of lockfile names"""
         return ['gradle.lockfile']
 
@@ -48,7 +68,7 @@ class JavaAdapter(EcosystemAdapter):
 
         for dirpath, dirnames, filenames in os.walk(self.root_dir):
             # Skip common excluded directories
-            dirnames[:] = [d for d in dirnames if not self._should_skip_directory(Path(dirpath) / d)]
+            dirnames[:] = [d for d in dirnames if not self._should_skip_dir_name(d)]
 
             # Check for Maven or Gradle files
             if 'pom.xml' in filenames or 'build.gradle' in filenames or 'build.gradle.kts' in filenames:
@@ -137,7 +157,7 @@ class JavaAdapter(EcosystemAdapter):
                         # Check if version is a property reference like ${some.version}
                         if version_spec.startswith('${') and version_spec.endswith('}'):
                             # Property reference - we can't resolve it without full Maven context
-                            click.echo(click.style(
+                            self._echo(click.style(
                                 f"⚠️  Warning: {package_name} uses property {version_spec}, cannot check version",
                                 fg='yellow', dim=True), err=True)
                             continue
@@ -149,16 +169,17 @@ class JavaAdapter(EcosystemAdapter):
                                 version_spec, package_name)
 
                             if matching_versions:
+                                matching_versions.sort()
                                 findings.append(Finding(
                                     ecosystem='maven',
                                     finding_type='manifest',
                                     file_path=str(file_path),
                                     package_name=package_name,
-                                    version=", ".join(sorted(matching_versions)),
+                                    version=", ".join(matching_versions),
                                     match_type='range',
                                     declared_spec=version_spec,
                                     dependency_type='dependency',
-                                    metadata={'included_versions': sorted(matching_versions)}
+                                    metadata={'included_versions': matching_versions}
                                 ))
                         else:
                             # Specific version
@@ -178,11 +199,11 @@ class JavaAdapter(EcosystemAdapter):
                     break  # Found dependencies, no need to try other namespace
 
         except ET.ParseError as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Invalid XML in {file_path}: {e}",
                 fg='yellow'), err=True)
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -213,22 +234,18 @@ class JavaAdapter(EcosystemAdapter):
             # implementation group: 'group', name: 'artifact', version: 'version'
             # implementation("group:artifact:version")  // Kotlin DSL
 
-            # Pattern 1: String literal format (most common)
-            # Matches: 'group:artifact:version' or "group:artifact:version"
-            pattern1 = r'''(?:implementation|compile|api|runtimeOnly|compileOnly|testImplementation|testCompile)\s*[(\s]*['"]([\w\.\-]+):([\w\.\-]+):([\w\.\-\+]+)['"]'''
-
-            # Pattern 2: Map format
-            # Matches: group: 'group', name: 'artifact', version: 'version'
-            pattern2 = r'''(?:implementation|compile|api|runtimeOnly|compileOnly|testImplementation|testCompile)\s+group:\s*['"]([^'"]+)['"],\s*name:\s*['"]([^'"]+)['"],\s*version:\s*['"]([^'"]+)['"]'''
-
-            for pattern in [pattern1, pattern2]:
-                matches = re.finditer(pattern, content)
-
-                for match in matches:
-                    group_id = match.group(1)
-                    artifact_id = match.group(2)
-                    version = match.group(3)
+            # One pass finds both formats; string literal declarations are
+            # reported before map declarations, as when scanned separately
+            string_declarations = []
+            map_declarations = []
+            for match in _GRADLE_DEPENDENCY_PATTERN.finditer(content):
+                if match.group(1) is not None:
+                    string_declarations.append(match.group(1, 2, 3))
+                else:
+                    map_declarations.append(match.group(4, 5, 6))
 
+            for declarations in (string_declarations, map_declarations):
+                for group_id, artifact_id, version in declarations:
                     package_name = f"{group_id}:{artifact_id}"
 
                     if package_name not in self.compromised_packages:
@@ -241,16 +258,17 @@ class JavaAdapter(EcosystemAdapter):
                             version, package_name)
 
                         if matching_versions:
+                            matching_versions.sort()
                             findings.append(Finding(
                                 ecosystem='maven',
                                 finding_type='manifest',
                                 file_path=str(file_path),
                                 package_name=package_name,
-                                version=", ".join(sorted(matching_versions)),
+                                version=", ".join(matching_versions),
                                 match_type='range',
                                 declared_spec=version,
                                 dependency_type='dependency',
-                                metadata={'included_versions': sorted(matching_versions)}
+                                metadata={'included_versions': matching_versions}
                             ))
                     else:
                         # Specific version
@@ -267,7 +285,7 @@ class JavaAdapter(EcosystemAdapter):
                             ))
 
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -293,10 +311,10 @@ class JavaAdapter(EcosystemAdapter):
 
             # Gradle lockfile format:
             # group:artifact:version=classpath,config1,config2
-            pattern = r'^([\w\.\-]+):([\w\.\-]+):([\w\.\-]+)='
+            match_entry = _GRADLE_LOCKFILE_PATTERN.match
 
             for line in content.split('\n'):
-                match = re.match(pattern, line.strip())
+                match = match_entry(line.strip())
                 if match:
                     group_id = match.group(1)
                     artifact_id = match.group(2)
@@ -317,7 +335,7 @@ class JavaAdapter(EcosystemAdapter):
                             ))
 
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -341,7 +359,7 @@ class JavaAdapter(EcosystemAdapter):
         Returns:
             True if it's a range, False otherwise
         """
-        return bool(re.match(r'^[\[\(].*[\]\)]$', version_spec.strip()))
+        return bool(_MAVEN_RANGE_PATTERN.match(version_spec.strip()))
 
     def _get_matching_maven_versions(
         self, version_range: str, package_name: str
@@ -363,7 +381,7 @@ class JavaAdapter(EcosystemAdapter):
 
         # Parse the range
         # Example: [1.0,2.0) means 1.0 <= x < 2.0
-        match = re.match(r'^([\[\(])(.*?),(.*?)([\]\)])$', version_range.strip())
+        match = _MAVEN_RANGE_BOUNDS_PATTERN.match(version_range.strip())
         if not match:
             return matching
 
@@ -448,12 +466,13 @@ class JavaAdapter(EcosystemAdapter):
         """
         matching = []
 
-        # Convert 1.2.+ to regex pattern 1\.2\.\d+
+        # Convert 1.2.+ to regex pattern 1\.2\.\d+, compiled once for all
+        # of the package's compromised versions
         pattern = dynamic_spec.replace('+', r'\d+').replace('.', r'\.')
-        pattern = f'^{pattern}$'
+        match_version = re.compile(f'^{pattern}$').match
 
         for version in self.compromised_packages[package_name]:
-            if re.match(pattern, version):
+            if match_version(version):
                 matching.append(version)
 
         return matching
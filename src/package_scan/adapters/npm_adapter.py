@@ -3,16 +3,198 @@
 import json
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 
 import click
 from semantic_version import Version, NpmSpec
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup (pip install orjson); fall back to stdlib json
+    orjson = None
+
+try:
+    import ijson
+    # Only the C (yajl2) backends are faster than json.load; the pure
+    # Python backend is many times slower, so it isn't used
+    if not ijson.backend.startswith('yajl2'):
+        ijson = None
+except ImportError:
+    # Optional speedup (pip install ijson); fall back to json.load
+    ijson = None
+
 from package_scan.core import Finding
 from .base import EcosystemAdapter
 
 
+# yarn.lock entry header ("name@range", ...:) and its version line
+_YARN_ENTRY_NAME_PATTERN = re.compile(r'["\']?(@?[^@"\s]+)@')
+_YARN_VERSION_PATTERN = re.compile(r'^\s+version\s+"([^"]+)"')
+
+# pnpm-lock.yaml package key: /name/1.2.3 or /@scope/name/1.2.3_peer
+_PNPM_PACKAGE_KEY_PATTERN = re.compile(r'^/(@?[^/]+(?:/[^/]+)?)/(.+?)(?:_|$)')
+
+# Range shapes with plain integer bounds (exact, ^, ~, >=) and plain releases,
+# which can be compared as (major, minor, patch) tuples without NpmSpec
+_SIMPLE_RANGE_PATTERN = re.compile(r'^(\^|~|>=)?(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)$')
+_RELEASE_PATTERN = re.compile(r'^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)$')
+
+# (lower, upper) release bounds; upper is exclusive, None when unbounded
+_RangeBounds = Tuple[Tuple[int, int, int], Optional[Tuple[int, int, int]]]
+
+# A substring probe costs one pass over the lockfile text per name, so it
+# only beats the line walkers below for small compromised sets
+_MAX_PROBE_NAMES = 16
+
+# npm writes lockfileVersion among the first top-level keys, so reading the
+# head of a package-lock.json tells whether it has a flat 'packages' object
+_LOCKFILE_VERSION_PATTERN = re.compile(rb'"lockfileVersion"\s*:\s*(\d+)')
+_LOCK_HEADER_BYTES = 4096
+
+# pnpm-lock.yaml mapping key as written in the raw text (plain, quoted or
+# explicit "? " key), used to screen files before the YAML parse
+_PNPM_KEY_LINE_PATTERN = re.compile(r'''^[ \t]*(?:\?[ \t]+)?['"]?(/[^\s'":]+)''', re.MULTILINE)
+
+
+def _load_json(file_path: Path):
+    """
+    Parse a JSON file, using orjson when installed
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    handle malformed files the same way with either parser.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=4096)
+def _parse_npm_spec(version_spec: str) -> Optional[NpmSpec]:
+    """
+    Parse an npm semver range, caching the result
+
+    Monorepos declare the same ranges in many package.json files, so each
+    distinct range is parsed once.
+
+    Args:
+        version_spec: Range as declared in package.json
+
+    Returns:
+        NpmSpec, or None if the range is not standard npm semver
+    """
+    try:
+        return NpmSpec(version_spec)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _simple_range_bounds(version_spec: str) -> Optional[_RangeBounds]:
+    """
+    Resolve a common npm range to half-open release tuple bounds
+
+    Handles exact versions and ^, ~ and >= ranges over plain A.B.C versions,
+    which cover almost every range declared in package.json. For release
+    versions (no prerelease tag) the bounds give the same answer as NpmSpec.
+
+    Args:
+        version_spec: Range as declared in package.json
+
+    Returns:
+        (lower, upper) bounds, or None if the range needs NpmSpec
+    """
+    match = _SIMPLE_RANGE_PATTERN.match(version_spec)
+    if not match:
+        return None
+
+    operator = match.group(1)
+    major, minor, patch = int(match.group(2)), int(match.group(3)), int(match.group(4))
+    lower = (major, minor, patch)
+
+    if operator is None:
+        return lower, (major, minor, patch + 1)
+    if operator == '>=':
+        return lower, None
+    if operator == '~':
+        return lower, (major, minor + 1, 0)
+    # Caret allows changes that do not modify the left-most non-zero part
+    if major:
+        return lower, (major + 1, 0, 0)
+    if minor:
+        return lower, (0, minor + 1, 0)
+    return lower, (0, 0, patch + 1)
+
+
+@lru_cache(maxsize=4096)
+def _release_tuple(version: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a plain A.B.C release version, caching the result
+
+    Args:
+        version: Version string from the threat database
+
+    Returns:
+        (major, minor, patch), or None for prereleases and other forms
+    """
+    match = _RELEASE_PATTERN.match(version)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+@lru_cache(maxsize=4096)
+def _coerce_version(version: str) -> Optional[Version]:
+    """
+    Coerce a compromised version string to a semver Version, caching the result
+
+    Args:
+        version: Version string from the threat database
+
+    Returns:
+        Version, or None if it cannot be coerced
+    """
+    try:
+        return Version.coerce(version)
+    except Exception:
+        return None
+
+
+def _match_lockfile_entries(
+    packages_to_check: Dict[str, str], compromised: Dict[str, Set[str]]
+) -> List[Tuple[str, str]]:
+    """
+    Match resolved lockfile names/versions against compromised packages
+
+    Args:
+        packages_to_check: Mapping of package name to resolved version
+        compromised: Mapping of package name to compromised versions
+
+    Returns:
+        List of (package_name, version) tuples for each compromised entry
+    """
+    matches = []
+    get_versions = compromised.get
+
+    for name, version in packages_to_check.items():
+        bad_versions = get_versions(name)
+        if bad_versions is not None and version in bad_versions:
+            matches.append((name, version))
+
+    return matches
+
+
 class NpmAdapter(EcosystemAdapter):
     """
     Adapter for scanning npm/JavaScript/Node.js projects
@@ -28,11 +210,13 @@ class NpmAdapter(EcosystemAdapter):
         """Return ecosystem identifier"""
         return 'npm'
 
-    def get_manifest_files(self) -> List[str]:
+    @classmethod
+    def get_manifest_files(cls) -> List[str]:
         """Return list of manifest file names"""
         return ['package.json']
 
-    def get_lockfile_names(self) -> List[str]:
+    @classmethod
+    def get_lockfile_names(cls) -> List[str]:
         """Return list of lockfile names"""
         return ['package-lock.json', 'yarn.lock', 'pnpm-lock.yaml']
 
@@ -47,7 +231,7 @@ class NpmAdapter(EcosystemAdapter):
 
         for dirpath, dirnames, filenames in os.walk(self.root_dir):
             # Skip common excluded directories
-            dirnames[:] = [d for d in dirnames if not self._should_skip_directory(Path(dirpath) / d)]
+            dirnames[:] = [d for d in dirnames if not self._should_skip_dir_name(d)]
 
             if 'package.json' in filenames:
                 projects.append(Path(dirpath))
@@ -105,8 +289,7 @@ class NpmAdapter(EcosystemAdapter):
         findings = []
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                package_data = json.load(f)
+            package_data = _load_json(file_path)
 
             # Check all dependency types
             dep_types = ['dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies']
@@ -120,24 +303,26 @@ class NpmAdapter(EcosystemAdapter):
                         continue
 
                     # Try to parse as npm semver range
-                    try:
-                        spec = NpmSpec(str(version_spec))
-                        included_versions = self._get_matching_versions(spec, package_name)
+                    spec = _parse_npm_spec(str(version_spec))
+                    if spec is not None:
+                        included_versions = self._get_matching_versions(
+                            spec, package_name, _simple_range_bounds(str(version_spec)))
 
                         if included_versions:
+                            # Sort once for both the display string and metadata
+                            included_versions.sort()
                             findings.append(Finding(
                                 ecosystem='npm',
                                 finding_type='manifest',
                                 file_path=str(file_path),
                                 package_name=package_name,
-                                version=", ".join(sorted(included_versions)),
+                                version=", ".join(included_versions),
                                 match_type='range',
                                 declared_spec=version_spec,
                                 dependency_type=dep_type,
-                                metadata={'included_versions': sorted(included_versions)}
+                                metadata={'included_versions': included_versions}
                             ))
-
-                    except Exception:
+                    else:
                         # Not a standard semver spec; try exact match
                         clean_version = str(version_spec).lstrip('^~>=<')
                         if clean_version in self.compromised_packages[package_name]:
@@ -153,19 +338,22 @@ class NpmAdapter(EcosystemAdapter):
                             ))
 
         except json.JSONDecodeError:
-            click.echo(click.style(f"⚠️  Warning: Invalid JSON in {file_path}", fg='yellow'), err=True)
+            self._echo(click.style(f"⚠️  Warning: Invalid JSON in {file_path}", fg='yellow'), err=True)
         except Exception as e:
-            click.echo(click.style(f"⚠️  Warning: Error reading {file_path}: {e}", fg='yellow'), err=True)
+            self._echo(click.style(f"⚠️  Warning: Error reading {file_path}: {e}", fg='yellow'), err=True)
 
         return findings
 
-    def _get_matching_versions(self, spec: NpmSpec, package_name: str) -> List[str]:
+    def _get_matching_versions(self, spec: NpmSpec, package_name: str,
+                               bounds: Optional[_RangeBounds] = None) -> List[str]:
         """
         Get compromised versions that match the npm semver spec
 
         Args:
             spec: NpmSpec range
             package_name: Package name
+            bounds: Optional release tuple bounds for the same range (from
+                _simple_range_bounds), used instead of NpmSpec where possible
 
         Returns:
             List of matching compromised versions
@@ -173,12 +361,17 @@ class NpmAdapter(EcosystemAdapter):
         included_versions = []
 
         for compromised_version in self.compromised_packages[package_name]:
-            try:
-                v = Version.coerce(compromised_version)
-                if v in spec:
-                    included_versions.append(compromised_version)
-            except Exception:
-                continue
+            if bounds is not None:
+                release = _release_tuple(compromised_version)
+                if release is not None:
+                    lower, upper = bounds
+                    if lower <= release and (upper is None or release < upper):
+                        included_versions.append(compromised_version)
+                    continue
+
+            v = _coerce_version(compromised_version)
+            if v is not None and v in spec:
+                included_versions.append(compromised_version)
 
         return included_versions
 
@@ -198,65 +391,131 @@ class NpmAdapter(EcosystemAdapter):
         findings = []
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lock_data = json.load(f)
-
-            packages_to_check = {}
+            packages_to_check = self._stream_lock_packages(file_path) if ijson is not None else None
 
-            # Handle lockfileVersion 3+ (npm v7+)
-            if 'packages' in lock_data:
-                for package_path, package_info in lock_data['packages'].items():
-                    if not package_path:  # Root package
-                        continue
-                    # Remove "node_modules/" prefix
-                    package_name = package_path.replace('node_modules/', '')
-                    version = package_info.get('version')
-                    if version:
-                        packages_to_check[package_name] = version
+            if packages_to_check is None:
+                lock_data = _load_json(file_path)
 
-            # Handle lockfileVersion 1/2 (older npm)
-            elif 'dependencies' in lock_data:
-                self._extract_lock_v1_dependencies(lock_data['dependencies'], packages_to_check)
+                packages_to_check = self._extract_lock_packages(lock_data)
 
             # Check for compromised packages
-            for package_name, version in packages_to_check.items():
-                if package_name in self.compromised_packages:
-                    if version in self.compromised_packages[package_name]:
-                        findings.append(Finding(
-                            ecosystem='npm',
-                            finding_type='lockfile',
-                            file_path=str(file_path),
-                            package_name=package_name,
-                            version=version,
-                            match_type='exact',
-                            metadata={'lockfile_type': 'package-lock.json'}
-                        ))
+            for package_name, version in _match_lockfile_entries(
+                    packages_to_check, self.compromised_packages):
+                findings.append(Finding(
+                    ecosystem='npm',
+                    finding_type='lockfile',
+                    file_path=str(file_path),
+                    package_name=package_name,
+                    version=version,
+                    match_type='exact',
+                    metadata={'lockfile_type': 'package-lock.json'}
+                ))
 
         except json.JSONDecodeError:
-            click.echo(click.style(f"⚠️  Warning: Invalid JSON in {file_path}", fg='yellow'), err=True)
+            self._echo(click.style(f"⚠️  Warning: Invalid JSON in {file_path}", fg='yellow'), err=True)
         except Exception as e:
-            click.echo(click.style(f"⚠️  Warning: Error reading {file_path}: {e}", fg='yellow'), err=True)
+            if ijson is not None and isinstance(e, ijson.JSONError):
+                self._echo(click.style(f"⚠️  Warning: Invalid JSON in {file_path}", fg='yellow'), err=True)
+            else:
+                self._echo(click.style(f"⚠️  Warning: Error reading {file_path}: {e}", fg='yellow'), err=True)
 
         return findings
 
+    @staticmethod
+    def _stream_lock_packages(file_path: Path) -> Optional[Dict[str, str]]:
+        """
+        Stream the flat packages object of a package-lock.json with ijson
+
+        Only name -> version pairs are kept, so large lockfiles are never
+        held in memory as a whole.
+
+        Args:
+            file_path: Path to package-lock.json
+
+        Returns:
+            Mapping of package name to version, or None if the lockfile has
+            no entries under 'packages' (lockfileVersion 1)
+        """
+        packages_to_check = {}
+        seen_any = False
+
+        with open(file_path, 'rb') as f:
+            # A v1 lockfile has no 'packages' object; streaming it would
+            # read the whole file only for json.load to parse it again
+            match = _LOCKFILE_VERSION_PATTERN.search(f.read(_LOCK_HEADER_BYTES))
+            if match and int(match.group(1)) < 2:
+                return None
+            f.seek(0)
+
+            for package_path, package_info in ijson.kvitems(f, 'packages'):
+                seen_any = True
+                if not package_path:  # Root package
+                    continue
+                # Remove "node_modules/" prefix
+                package_name = package_path.replace('node_modules/', '')
+                version = package_info.get('version')
+                if version:
+                    packages_to_check[package_name] = version
+
+        return packages_to_check if seen_any else None
+
+    def _extract_lock_packages(self, lock_data: dict) -> Dict[str, str]:
+        """
+        Extract package names and versions from a parsed package-lock.json
+
+        Args:
+            lock_data: Parsed lockfile
+
+        Returns:
+            Mapping of package name to version
+        """
+        packages_to_check = {}
+
+        # Handle lockfileVersion 3+ (npm v7+)
+        if 'packages' in lock_data:
+            for package_path, package_info in lock_data['packages'].items():
+                if not package_path:  # Root package
+                    continue
+                # Remove "node_modules/" prefix
+                package_name = package_path.replace('node_modules/', '')
+                version = package_info.get('version')
+                if version:
+                    packages_to_check[package_name] = version
+
+        # Handle lockfileVersion 1/2 (older npm)
+        elif 'dependencies' in lock_data:
+            self._extract_lock_v1_dependencies(lock_data['dependencies'], packages_to_check)
+
+        return packages_to_check
+
     def _extract_lock_v1_dependencies(self, deps: dict, output: dict, prefix: str = ""):
         """
-        Recursively extract dependencies from npm lock v1/v2 format
+        Extract dependencies from npm lock v1/v2 format, including nested ones
+
+        Walks the tree with an explicit stack rather than recursion, so deep
+        dependency trees cannot hit the recursion limit. Entries are still
+        visited depth-first in file order.
 
         Args:
             deps: Dependencies object from lock file
             output: Output dictionary to populate
             prefix: Package name prefix for nested dependencies
         """
-        for name, info in deps.items():
-            full_name = f"{prefix}{name}" if prefix else name
-            version = info.get('version')
-            if version:
-                output[full_name] = version
-            # Recurse into nested dependencies
-            if 'dependencies' in info:
-                self._extract_lock_v1_dependencies(
-                    info['dependencies'], output, f"{full_name}/node_modules/")
+        stack = [(iter(deps.items()), prefix)]
+
+        while stack:
+            items, prefix = stack[-1]
+            for name, info in items:
+                full_name = f"{prefix}{name}" if prefix else name
+                version = info.get('version')
+                if version:
+                    output[full_name] = version
+                # Descend into nested dependencies, resuming this level after
+                if 'dependencies' in info:
+                    stack.append((iter(info['dependencies'].items()), f"{full_name}/node_modules/"))
+                    break
+            else:
+                stack.pop()
 
     def _scan_yarn_lock(self, file_path: Path) -> List[Finding]:
         """
@@ -274,54 +533,58 @@ class NpmAdapter(EcosystemAdapter):
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
+            if not self._text_may_mention_compromised(content):
+                return findings
+
             # Yarn lock format:
             # package-name@^1.0.0, package-name@^1.2.0:
             #   version "1.2.3"
             #   resolved "..."
 
-            version_pattern = re.compile(r'^\s+version\s+"([^"]+)"', re.MULTILINE)
+            compromised = self.compromised_packages
             lines = content.split('\n')
+            line_count = len(lines)
+            find_name = _YARN_ENTRY_NAME_PATTERN.search
+            match_version = _YARN_VERSION_PATTERN.match
 
-            i = 0
-            while i < len(lines):
-                line = lines[i]
-
+            for i, line in enumerate(lines):
                 # Check if this line starts a package entry
                 if '@' in line and ':' in line and not line.strip().startswith('#'):
                     # Extract package name (handle scoped packages)
-                    pkg_match = re.search(r'["\']?(@?[^@"\s]+)@', line)
-                    if pkg_match:
-                        package_name = pkg_match.group(1)
-
-                        # Look ahead for version line
-                        j = i + 1
-                        while j < len(lines) and j < i + 10:  # Look up to 10 lines ahead
-                            version_match = version_pattern.match(lines[j])
-                            if version_match:
-                                version = version_match.group(1)
-
-                                if package_name in self.compromised_packages:
-                                    if version in self.compromised_packages[package_name]:
-                                        findings.append(Finding(
-                                            ecosystem='npm',
-                                            finding_type='lockfile',
-                                            file_path=str(file_path),
-                                            package_name=package_name,
-                                            version=version,
-                                            match_type='exact',
-                                            metadata={'lockfile_type': 'yarn.lock'}
-                                        ))
-                                break
-
-                            # Stop if we hit a blank line or next package entry
-                            if not lines[j].strip() or ('@' in lines[j] and ':' in lines[j]):
-                                break
-                            j += 1
-
-                i += 1
+                    pkg_match = find_name(line)
+                    if not pkg_match:
+                        continue
+
+                    # Only compromised packages need their version looked up
+                    package_name = pkg_match.group(1)
+                    if package_name not in compromised:
+                        continue
+
+                    # Look ahead for version line, up to 10 lines ahead
+                    for j in range(i + 1, min(line_count, i + 10)):
+                        next_line = lines[j]
+                        version_match = match_version(next_line)
+                        if version_match:
+                            version = version_match.group(1)
+
+                            if version in compromised[package_name]:
+                                findings.append(Finding(
+                                    ecosystem='npm',
+                                    finding_type='lockfile',
+                                    file_path=str(file_path),
+                                    package_name=package_name,
+                                    version=version,
+                                    match_type='exact',
+                                    metadata={'lockfile_type': 'yarn.lock'}
+                                ))
+                            break
+
+                        # Stop if we hit a blank line or next package entry
+                        if not next_line.strip() or ('@' in next_line and ':' in next_line):
+                            break
 
         except Exception as e:
-            click.echo(click.style(f"⚠️  Warning: Error reading {file_path}: {e}", fg='yellow'), err=True)
+            self._echo(click.style(f"⚠️  Warning: Error reading {file_path}: {e}", fg='yellow'), err=True)
 
         return findings
 
@@ -342,16 +605,27 @@ class NpmAdapter(EcosystemAdapter):
             try:
                 import yaml
             except ImportError:
-                click.echo(click.style(
+                self._echo(click.style(
                     f"⚠️  Warning: PyYAML not installed, skipping {file_path}",
                     fg='yellow'), err=True)
-                click.echo(click.style(
+                self._echo(click.style(
                     "   Install with: pip install pyyaml",
                     fg='yellow', dim=True), err=True)
                 return findings
 
             with open(file_path, 'r', encoding='utf-8') as f:
-                lock_data = yaml.safe_load(f)
+                content = f.read()
+
+            # Most lockfiles reference no compromised package at all, and the
+            # YAML parse dominates the scan, so only parse when a key does
+            if (not self._text_may_mention_compromised(content)
+                    or not self._pnpm_keys_reference_compromised(content)):
+                return findings
+
+            # libyaml's C loader is several times faster on large lockfiles;
+            # both loaders build the same safe subset of YAML
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            lock_data = yaml.load(content, Loader=loader)
 
             if not lock_data:
                 return findings
@@ -362,7 +636,7 @@ class NpmAdapter(EcosystemAdapter):
             for package_key, package_info in packages.items():
                 # Package key format: /package-name/1.2.3 or /@scope/package-name/1.2.3
                 # Extract name and version
-                match = re.match(r'^/(@?[^/]+(?:/[^/]+)?)/(.+?)(?:_|$)', package_key)
+                match = _PNPM_PACKAGE_KEY_PATTERN.match(package_key)
                 if match:
                     package_name = match.group(1)
                     version = match.group(2)
@@ -380,10 +654,54 @@ class NpmAdapter(EcosystemAdapter):
                             ))
 
         except Exception as e:
-            click.echo(click.style(f"⚠️  Warning: Error reading {file_path}: {e}", fg='yellow'), err=True)
+            self._echo(click.style(f"⚠️  Warning: Error reading {file_path}: {e}", fg='yellow'), err=True)
 
         return findings
 
+    def _text_may_mention_compromised(self, content: str) -> bool:
+        """
+        Cheaply rule out lockfile text that names no compromised package
+
+        A package can only be found if its name occurs somewhere in the
+        text, so for small compromised sets a plain substring probe per name
+        skips the parse of clean files. Larger sets always pass.
+
+        Args:
+            content: Raw lockfile contents
+
+        Returns:
+            True if the file still needs scanning, False if it is clean
+        """
+        compromised = self.compromised_packages
+        if len(compromised) > _MAX_PROBE_NAMES:
+            return True
+
+        return any(package_name in content for package_name in compromised)
+
+    def _pnpm_keys_reference_compromised(self, content: str) -> bool:
+        """
+        Check whether any package key in raw pnpm-lock.yaml text names a
+        compromised package
+
+        Keys are read straight from the text, so this is a superset screen:
+        a file it rejects cannot yield findings from the full parse.
+
+        Args:
+            content: pnpm-lock.yaml file contents
+
+        Returns:
+            True if the file needs a full parse, False if it is clean
+        """
+        compromised = self.compromised_packages
+        match_key = _PNPM_PACKAGE_KEY_PATTERN.match
+
+        for key_match in _PNPM_KEY_LINE_PATTERN.finditer(content):
+            match = match_key(key_match.group(1))
+            if match and match.group(1) in compromised:
+                return True
+
+        return False
+
     def _scan_node_modules(self, node_modules_path: Path) -> List[Finding]:
         """
         Scan installed packages in node_modules directory
@@ -398,34 +716,49 @@ class NpmAdapter(EcosystemAdapter):
 
         try:
             items = list(node_modules_path.iterdir())
+            spinner = self.spinner
+            compromised = self.compromised_packages
+
+            # Most installed packages are not compromised, so the name is
+            # checked before touching the filesystem. Scope directories are
+            # only listed when some compromised package lives in that scope.
+            compromised_scopes = {
+                name.split('/', 1)[0] for name in compromised if name.startswith('@')
+            }
 
             for idx, item_path in enumerate(items):
-                # Update spinner with progress
-                progress = f"[{idx+1}/{len(items)}]"
-                self.spinner.update(f"{progress} Scanning {node_modules_path}/{item_path.name}")
+                # Update spinner with progress (skip formatting when it is off)
+                if spinner.enabled:
+                    progress = f"[{idx+1}/{len(items)}]"
+                    spinner.update(f"{progress} Scanning {node_modules_path}/{item_path.name}")
+
+                item_name = item_path.name
 
                 # Handle scoped packages (@org/package)
-                if item_path.name.startswith('@') and item_path.is_dir():
+                if item_name.startswith('@'):
+                    if item_name not in compromised_scopes or not item_path.is_dir():
+                        continue
+
                     for scoped_package in item_path.iterdir():
-                        if scoped_package.is_dir():
-                            package_name = f"{item_path.name}/{scoped_package.name}"
+                        package_name = f"{item_name}/{scoped_package.name}"
+                        if package_name in compromised and scoped_package.is_dir():
                             finding = self._check_installed_package(
                                 scoped_package, package_name, node_modules_path)
                             if finding:
                                 findings.append(finding)
 
-                elif item_path.is_dir():
+                elif item_name in compromised and item_path.is_dir():
                     finding = self._check_installed_package(
                         item_path, item_path.name, node_modules_path)
                     if finding:
                         findings.append(finding)
 
         except PermissionError:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Permission denied accessing {node_modules_path}",
                 fg='yellow'), err=True)
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error scanning {node_modules_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -453,8 +786,7 @@ class NpmAdapter(EcosystemAdapter):
             return None
 
         try:
-            with open(package_json_path, 'r', encoding='utf-8') as f:
-                package_data = json.load(f)
+            package_data = _load_json(package_json_path)
 
             installed_version = package_data.get('version', 'unknown')
 
@@ -473,7 +805,7 @@ class NpmAdapter(EcosystemAdapter):
                 )
 
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error checking {package_json_path}: {e}",
                 fg='yellow'), err=True)
 
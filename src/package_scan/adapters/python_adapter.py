@@ -12,6 +12,13 @@ from package_scan.core import Finding
 from .base import EcosystemAdapter
 
 
+# Requirement line: package[extras]==version or package>=version,<version
+_REQUIREMENT_PATTERN = re.compile(r'^([a-zA-Z0-9_\-\.]+)(\[.*?\])?\s*(.*)$')
+
+# pip entry in a conda environment.yml: package==version
+_PIP_DEPENDENCY_PATTERN = re.compile(r'^([a-zA-Z0-9_\-\.]+)\s*(.*)$')
+
+
 class PythonAdapter(EcosystemAdapter):
     """
     Adapter for scanning Python projects
@@ -30,11 +37,13 @@ class PythonAdapter(EcosystemAdapter):
         """Return ecosystem identifier"""
         return 'pip'
 
-    def get_manifest_files(self) -> List[str]:
+    @classmethod
+    def get_manifest_files(cls) -> List[str]:
         """Return list of manifest file names"""
         return ['requirements.txt', 'pyproject.toml', 'Pipfile', 'environment.yml', 'setup.py']
 
-    def get_lockfile_names(self) -> List[str]:
+    @classmethod
+    def get_lockfile_names(cls) -> List[str]:
         """Return list of lockfile names"""
         return ['poetry.lock', 'Pipfile.lock', 'conda-lock.yml']
 
@@ -49,7 +58,7 @@ class PythonAdapter(EcosystemAdapter):
 
         for dirpath, dirnames, filenames in os.walk(self.root_dir):
             # Skip common excluded directories
-            dirnames[:] = [d for d in dirnames if not self._should_skip_directory(Path(dirpath) / d)]
+            dirnames[:] = [d for d in dirnames if not self._should_skip_dir_name(d)]
 
             # Check for Python manifest files
             manifest_files = {
@@ -151,7 +160,7 @@ class PythonAdapter(EcosystemAdapter):
 
                 # Parse package specification
                 # Pattern: package[extras]==version or package>=version,<version
-                match = re.match(r'^([a-zA-Z0-9_\-\.]+)(\[.*?\])?\s*(.*)$', line)
+                match = _REQUIREMENT_PATTERN.match(line)
                 if not match:
                     continue
 
@@ -188,20 +197,21 @@ class PythonAdapter(EcosystemAdapter):
                         version_spec, package_name)
 
                     if matching_versions:
+                        matching_versions.sort()
                         findings.append(Finding(
                             ecosystem='pip',
                             finding_type='manifest',
                             file_path=str(file_path),
                             package_name=package_name,
-                            version=", ".join(sorted(matching_versions)),
+                            version=", ".join(matching_versions),
                             match_type='range',
                             declared_spec=version_spec,
                             dependency_type='requirement',
-                            metadata={'included_versions': sorted(matching_versions)}
+                            metadata={'included_versions': matching_versions}
                         ))
 
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -227,10 +237,10 @@ class PythonAdapter(EcosystemAdapter):
                 try:
                     import tomli as toml
                 except ImportError:
-                    click.echo(click.style(
+                    self._echo(click.style(
                         f"⚠️  Warning: toml/tomli not installed, skipping {file_path}",
                         fg='yellow'), err=True)
-                    click.echo(click.style(
+                    self._echo(click.style(
                         "   Install with: pip install toml",
                         fg='yellow', dim=True), err=True)
                     return findings
@@ -274,20 +284,21 @@ class PythonAdapter(EcosystemAdapter):
                         pep440_spec, package_name)
 
                     if matching_versions:
+                        matching_versions.sort()
                         findings.append(Finding(
                             ecosystem='pip',
                             finding_type='manifest',
                             file_path=str(file_path),
                             package_name=package_name,
-                            version=", ".join(sorted(matching_versions)),
+                            version=", ".join(matching_versions),
                             match_type='range' if len(matching_versions) > 1 else 'exact',
                             declared_spec=version_spec,
                             dependency_type=dep_type,
-                            metadata={'included_versions': sorted(matching_versions)}
+                            metadata={'included_versions': matching_versions}
                         ))
 
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -338,7 +349,7 @@ class PythonAdapter(EcosystemAdapter):
                         ))
 
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -394,20 +405,21 @@ class PythonAdapter(EcosystemAdapter):
                         version_spec, package_name)
 
                     if matching_versions:
+                        matching_versions.sort()
                         findings.append(Finding(
                             ecosystem='pip',
                             finding_type='manifest',
                             file_path=str(file_path),
                             package_name=package_name,
-                            version=", ".join(sorted(matching_versions)),
+                            version=", ".join(matching_versions),
                             match_type='range' if len(matching_versions) > 1 else 'exact',
                             declared_spec=version_spec,
                             dependency_type=dep_type,
-                            metadata={'included_versions': sorted(matching_versions)}
+                            metadata={'included_versions': matching_versions}
                         ))
 
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -450,11 +462,11 @@ class PythonAdapter(EcosystemAdapter):
                             ))
 
         except json.JSONDecodeError:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Invalid JSON in {file_path}",
                 fg='yellow'), err=True)
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
@@ -477,7 +489,7 @@ class PythonAdapter(EcosystemAdapter):
             try:
                 import yaml
             except ImportError:
-                click.echo(click.style(
+                self._echo(click.style(
                     f"⚠️  Warning: PyYAML not installed, skipping {file_path}",
                     fg='yellow'), err=True)
                 return findings
@@ -497,7 +509,7 @@ class PythonAdapter(EcosystemAdapter):
                     if 'pip' in dep:
                         for pip_dep in dep['pip']:
                             # Parse pip format
-                            match = re.match(r'^([a-zA-Z0-9_\-\.]+)\s*(.*)$', pip_dep)
+                            match = _PIP_DEPENDENCY_PATTERN.match(pip_dep)
                             if match:
                                 package_name = match.group(1).lower()
                                 version_spec = match.group(2).strip()
@@ -538,7 +550,7 @@ class PythonAdapter(EcosystemAdapter):
                             ))
 
         except Exception as e:
-            click.echo(click.style(
+            self._echo(click.style(
                 f"⚠️  Warning: Error reading {file_path}: {e}",
                 fg='yellow'), err=True)
 
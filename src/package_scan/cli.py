@@ -11,14 +11,17 @@ CLI usage:
 
 import os
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 import click
 
-from package_scan.adapters import get_adapter_class, get_available_ecosystems
-from package_scan.adapters.base import ProgressSpinner
-from package_scan.core import ThreatDatabase, ReportEngine
+# Scanner components (threat database, adapters, semver parsing) are imported
+# inside the commands, so --help and --list-ecosystems don't pay for them.
+
+# Raw CSV lines joined into each click.echo call by threat-db info --csv
+CSV_ECHO_CHUNK_LINES = 4096
 
 
 def resolve_threats_dir() -> Path:
@@ -42,6 +45,64 @@ def resolve_threats_dir() -> Path:
     return candidates[0]
 
 
+# Mapping of indicator file names to ecosystems
+# Note: Both Maven and Gradle use 'maven' ecosystem (Maven Central artifact format)
+INDICATOR_TO_ECOSYSTEM = {
+    'package.json': 'npm',
+    'pom.xml': 'maven',
+    'build.gradle': 'maven',
+    'build.gradle.kts': 'maven',
+    'requirements.txt': 'pip',
+    'pyproject.toml': 'pip',
+    'setup.py': 'pip',
+    'Pipfile': 'pip',
+    'Gemfile': 'gem',
+}
+
+# Every ecosystem that can be detected (used to stop walking early)
+DETECTABLE_ECOSYSTEMS = frozenset(INDICATOR_TO_ECOSYSTEM.values())
+
+# Common directories that never need to be searched for indicator files
+EXCLUDED_DIRS = frozenset({
+    'node_modules', '.git', 'venv', 'env', '.venv',
+    'build', 'dist', 'target', 'vendor', '__pycache__'
+})
+
+
+def _iter_indicator_files(root_dir: Path) -> Iterator[str]:
+    """
+    Walk the directory tree and yield the ecosystem of each indicator file found
+
+    Uses os.scandir so file/directory checks come from the cached directory
+    entry type instead of an extra stat call per entry. Excluded directories
+    and hidden (dot) directories are pruned before they are ever opened.
+    Plain path-based scandir is deliberately used over os.fwalk or
+    dir_fd-relative opens: the extra open/close per directory costs more
+    than path lookups, which the kernel's dentry cache already makes cheap.
+
+    Args:
+        root_dir: Root directory to scan
+
+    Yields:
+        Ecosystem name for every indicator file encountered
+    """
+    stack = [os.fspath(root_dir)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in EXCLUDED_DIRS and not name.startswith('.'):
+                            stack.append(entry.path)
+                    elif name in INDICATOR_TO_ECOSYSTEM:
+                        yield INDICATOR_TO_ECOSYSTEM[name]
+        except OSError:
+            # Unreadable directory, skip it like os.walk does
+            continue
+
+
 def auto_detect_ecosystems(root_dir: Path) -> List[str]:
     """
     Auto-detect which ecosystems are present in the directory
@@ -54,29 +115,11 @@ def auto_detect_ecosystems(root_dir: Path) -> List[str]:
     """
     detected = set()
 
-    # Mapping of file patterns to ecosystems
-    # Note: Both Maven and Gradle use 'maven' ecosystem (Maven Central artifact format)
-    indicators = {
-        'npm': ['package.json'],
-        'maven': ['pom.xml', 'build.gradle', 'build.gradle.kts'],
-        'pip': ['requirements.txt', 'pyproject.toml', 'setup.py', 'Pipfile'],
-        'gem': ['Gemfile'],
-    }
-
-    # Walk directory tree looking for indicator files
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        # Skip common excluded directories
-        dirnames[:] = [d for d in dirnames if d not in {
-            'node_modules', '.git', 'venv', 'env', '.venv',
-            'build', 'dist', 'target', 'vendor', '__pycache__'
-        }]
-
-        for ecosystem, patterns in indicators.items():
-            if any(pattern in filenames for pattern in patterns):
-                detected.add(ecosystem)
-
-        # Early exit if we've found all possible ecosystems
-        if len(detected) == len(indicators):
+    for ecosystem in _iter_indicator_files(root_dir):
+        detected.add(ecosystem)
+
+        # Early exit as soon as every possible ecosystem has been found
+        if len(detected) == len(DETECTABLE_ECOSYSTEMS):
             break
 
     return sorted(detected)
@@ -92,11 +135,14 @@ def filter_available_ecosystems(requested: List[str]) -> List[str]:
     Returns:
         List of available ecosystem names, with warnings for unavailable ones
     """
+    from package_scan.adapters import get_available_ecosystems
+
     available = get_available_ecosystems()
+    available_set = frozenset(available)
     filtered = []
 
     for ecosystem in requested:
-        if ecosystem in available:
+        if ecosystem in available_set:
             filtered.append(ecosystem)
         else:
             click.echo(click.style(
@@ -113,7 +159,7 @@ def filter_available_ecosystems(requested: List[str]) -> List[str]:
 @click.option(
     "--dir",
     "scan_dir",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=str),
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
     default=lambda: os.getcwd(),
     show_default="current working directory",
     help="Root directory to scan recursively",
@@ -158,7 +204,7 @@ def filter_available_ecosystems(requested: List[str]) -> List[str]:
     help="List supported ecosystems and exit"
 )
 def cli(
-    scan_dir: str,
+    scan_dir: Path,
     threat_names: tuple,
     csv_file: Optional[str],
     ecosystems: Optional[str],
@@ -168,6 +214,8 @@ def cli(
 ):
     """Multi-ecosystem package threat scanner CLI"""
 
+    from package_scan.adapters import get_adapter_class, get_available_ecosystems
+
     # Handle --list-ecosystems
     if list_ecosystems:
         available = get_available_ecosystems()
@@ -180,12 +228,9 @@ def cli(
             adapter_class = get_adapter_class(ecosystem)
             click.echo(f"  • {click.style(ecosystem, fg='green', bold=True)}")
 
-            # Create a dummy instance to get file info
-            dummy_db = ThreatDatabase()
-            dummy_adapter = adapter_class(dummy_db, Path.cwd(), ProgressSpinner(enabled=False))
-
-            manifests = ', '.join(dummy_adapter.get_manifest_files())
-            lockfiles = ', '.join(dummy_adapter.get_lockfile_names())
+            # File info is static, so read it straight from the adapter class
+            manifests = ', '.join(adapter_class.get_manifest_files())
+            lockfiles = ', '.join(adapter_class.get_lockfile_names())
 
             click.echo(f"    Manifests: {manifests}")
             click.echo(f"    Lockfiles: {lockfiles}")
@@ -193,6 +238,11 @@ def cli(
 
         sys.exit(0)
 
+    from concurrent.futures import ThreadPoolExecutor
+
+    from package_scan.adapters.base import MAX_SCAN_WORKERS, ProgressSpinner
+    from package_scan.core import ThreatDatabase, ReportEngine
+
     # Resolve threats directory
     threats_dir = resolve_threats_dir()
 
@@ -201,13 +251,10 @@ def cli(
     click.echo(click.style("🛡️  Multi-Ecosystem Package Threat Scanner", fg='cyan', bold=True))
     click.echo(click.style("=" * 80, fg='cyan', bold=True))
 
-    # Validate and resolve scan directory
-    scan_dir = os.path.abspath(scan_dir)
-    if not os.path.isdir(scan_dir):
-        click.echo(click.style(f"✗ Error: Directory not found: {scan_dir}", fg='red', bold=True))
-        sys.exit(1)
+    # Resolve scan directory once (click has already validated it exists)
+    scan_path = scan_dir.resolve()
 
-    click.echo(f"\n{click.style('Scan Directory:', bold=True)} {scan_dir}")
+    click.echo(f"\n{click.style('Scan Directory:', bold=True)} {scan_path}")
     if csv_file:
         click.echo(f"{click.style('Custom CSV:', bold=True)} {csv_file}")
     elif threat_names:
@@ -222,7 +269,11 @@ def cli(
     # Convert threat_names tuple to list
     threat_list = list(threat_names) if threat_names else None
 
-    if not threat_db.load_threats(threat_names=threat_list, csv_file=csv_file):
+    # With an explicit --ecosystem, rows for other ecosystems are never needed
+    requested_ecosystems = [e.strip().lower() for e in ecosystems.split(',')] if ecosystems else None
+
+    if not threat_db.load_threats(threat_names=threat_list, csv_file=csv_file,
+                                  ecosystems=requested_ecosystems):
         sys.exit(1)
 
     threat_db.print_summary()
@@ -230,7 +281,6 @@ def cli(
     # Determine which ecosystems to scan
     if ecosystems:
         # User specified ecosystems
-        requested_ecosystems = [e.strip().lower() for e in ecosystems.split(',')]
         ecosystems_to_scan = filter_available_ecosystems(requested_ecosystems)
 
         if not ecosystems_to_scan:
@@ -247,7 +297,7 @@ def cli(
     else:
         # Auto-detect ecosystems
         click.echo(click.style("🔍 Auto-detecting ecosystems...", fg='cyan'))
-        detected = auto_detect_ecosystems(Path(scan_dir))
+        detected = auto_detect_ecosystems(scan_path)
 
         if not detected:
             click.echo(click.style(
@@ -281,23 +331,25 @@ def cli(
             fg='cyan', bold=True))
 
     # Initialize report engine
-    report_engine = ReportEngine(scan_dir=scan_dir)
+    report_engine = ReportEngine(scan_dir=str(scan_path))
 
     # Set threats in report engine
     report_engine.set_threats(threat_db.get_loaded_threats())
 
-    # Scan each ecosystem
-    spinner = ProgressSpinner()
+    # Resolve adapters for each ecosystem. get_ecosystems() builds a new set
+    # on every call, so take it once for the whole loop.
+    threat_ecosystems = threat_db.get_ecosystems()
+    adapter_classes = []
 
     for ecosystem in ecosystems_to_scan:
         # Check if ecosystem has threats in database
-        if ecosystem not in threat_db.get_ecosystems():
+        if ecosystem not in threat_ecosystems:
             click.echo(click.style(
                 f"\n⚠️  Note: No threats for {ecosystem} in database. Skipping.",
                 fg='yellow', dim=True))
             continue
 
-        # Get adapter class and instantiate
+        # Get adapter class
         adapter_class = get_adapter_class(ecosystem)
         if not adapter_class:
             click.echo(click.style(
@@ -305,11 +357,32 @@ def cli(
                 fg='yellow'), err=True)
             continue
 
-        adapter = adapter_class(threat_db, Path(scan_dir), spinner)
-
-        # Scan all projects for this ecosystem
-        findings = adapter.scan_all_projects()
-        report_engine.add_findings(findings)
+        adapter_classes.append(adapter_class)
+
+    # The spinner redraws a single terminal line, so it is only enabled when
+    # one adapter runs; concurrent adapters would overwrite each other
+    spinner = ProgressSpinner(enabled=len(adapter_classes) == 1)
+    adapters = [cls(threat_db, scan_path, spinner) for cls in adapter_classes]
+
+    # Ecosystem scans are independent and I/O bound, so run them concurrently.
+    # Workers only scan and buffer their console output, already in project
+    # order; each ecosystem's messages and findings are then emitted in
+    # ecosystem order on this thread, so the output is deterministic.
+    # Every adapter scans its projects on one shared pool, so the total
+    # thread count stays bounded by MAX_SCAN_WORKERS plus one per ecosystem.
+    if len(adapters) > 1:
+        with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as project_executor, \
+                ThreadPoolExecutor(max_workers=len(adapters)) as executor:
+            results = list(executor.map(
+                lambda adapter: adapter.scan_all_projects_buffered(project_executor), adapters))
+
+        for findings, output in results:
+            for message, err in output:
+                click.echo(message, err=err)
+            report_engine.add_findings(findings)
+    else:
+        for adapter in adapters:
+            report_engine.add_findings(adapter.scan_all_projects())
 
     spinner.clear()
 
@@ -402,14 +475,17 @@ def info_threat_db(file_path: str, threat_names: tuple, summary: bool, packages:
                     click.echo("#")  # Blank comment line separator
 
             if show_packages:
-                # Output raw CSV (with headers)
+                # Output raw CSV (with headers), streamed in chunks of joined
+                # lines rather than an echo per row
                 with open(Path(file_path), 'r', encoding='utf-8-sig') as f:
-                    for line in f:
-                        stripped = line.strip()
-                        # Skip comment lines (they're already output above if needed)
-                        if not stripped or stripped.startswith('#'):
-                            continue
-                        click.echo(line.rstrip())
+                    # Skip comment lines (they're already output above if needed)
+                    data_lines = (line.rstrip() + '\n' for line in f
+                                  if line.strip() and not line.lstrip().startswith('#'))
+                    while True:
+                        chunk = ''.join(islice(data_lines, CSV_ECHO_CHUNK_LINES))
+                        if not chunk:
+                            break
+                        click.echo(chunk, nl=False)
         else:
             # Formatted output
             metadata = parse_threat_metadata(Path(file_path))
@@ -429,7 +505,10 @@ def info_threat_db(file_path: str, threat_names: tuple, summary: bool, packages:
     threat_db = ThreatDatabase(threats_dir=str(threats_dir))
     threat_list = list(threat_names) if threat_names else None
 
-    if not threat_db.load_threats(threat_names=threat_list):
+    # Formatted summaries report per-file statistics; gather them during the
+    # load instead of re-reading every file afterwards
+    collect_stats = show_summary and not csv_output
+    if not threat_db.load_threats(threat_names=threat_list, collect_stats=collect_stats):
         sys.exit(1)
 
     if csv_output:
@@ -446,13 +525,12 @@ def info_threat_db(file_path: str, threat_names: tuple, summary: bool, packages:
                     click.echo("#")  # Blank comment line
 
         if show_packages:
-            # Output CSV data
-            click.echo("ecosystem,name,version")
+            # Output CSV data as a single write rather than one echo per row
+            rows = ["ecosystem,name,version"]
             for ecosystem in sorted(threat_db.get_ecosystems()):
-                packages_dict = threat_db.get_all_packages(ecosystem)
-                for pkg_name in sorted(packages_dict.keys()):
-                    for version in sorted(packages_dict[pkg_name]):
-                        click.echo(f"{ecosystem},{pkg_name},{version}")
+                for pkg_name, versions in threat_db.iter_sorted_packages(ecosystem):
+                    rows.extend(f"{ecosystem},{pkg_name},{version}" for version in versions)
+            click.echo("\n".join(rows))
     else:
         # Formatted output
         if show_summary:
@@ -460,7 +538,7 @@ def info_threat_db(file_path: str, threat_names: tuple, summary: bool, packages:
                 threat_file = threats_dir / f"{threat_name}.csv"
                 if threat_file.exists():
                     metadata = parse_threat_metadata(threat_file)
-                    metadata.compute_stats()
+                    metadata.compute_stats(threat_db.file_stats.get(threat_name))
                     metadata.print_metadata()
                     click.echo()
 
@@ -477,14 +555,25 @@ def _print_packages_from_file(file_path: Path):
     ecosystems = defaultdict(lambda: defaultdict(set))
 
     csv_content = get_csv_reader_without_comments(file_path)
-    reader = csv.DictReader(csv_content)
-
-    for row in reader:
-        ecosystem = row.get('ecosystem', '').strip().lower()
-        name = row.get('name', '').strip()
-        version = row.get('version', '').strip()
-        if ecosystem and name and version:
-            ecosystems[ecosystem][name].add(version)
+    reader = csv.reader(csv_content)
+    headers = next(reader, None) or []
+
+    # Resolve column positions once rather than building a dict per row;
+    # files without the expected columns simply list no packages
+    if {'ecosystem', 'name', 'version'}.issubset(headers):
+        eco_idx = headers.index('ecosystem')
+        name_idx = headers.index('name')
+        ver_idx = headers.index('version')
+        min_len = max(eco_idx, name_idx, ver_idx) + 1
+
+        for row in reader:
+            if len(row) < min_len:
+                continue
+            ecosystem = row[eco_idx].strip().lower()
+            name = row[name_idx].strip()
+            version = row[ver_idx].strip()
+            if ecosystem and name and version:
+                ecosystems[ecosystem][name].add(version)
 
     click.echo("\n" + click.style("=" * 80, fg='yellow', bold=True))
     click.echo(click.style("⚠️  COMPROMISED PACKAGES", fg='yellow', bold=True))
@@ -521,14 +610,11 @@ def _print_packages_formatted(threat_db):
     all_ecosystems = threat_db.get_ecosystems()
 
     for ecosystem in sorted(all_ecosystems):
-        packages = threat_db.get_all_packages(ecosystem)
-
         click.echo(f"\n{click.style(f'📦 {ecosystem.upper()}:', fg='magenta', bold=True)}")
-        click.echo(f"   {len(packages)} unique packages, "
+        click.echo(f"   {threat_db.get_package_count(ecosystem)} unique packages, "
                   f"{threat_db.get_version_count(ecosystem)} versions\n")
 
-        for pkg_name in sorted(packages.keys()):
-            versions = sorted(packages[pkg_name])
+        for pkg_name, versions in threat_db.iter_sorted_packages(ecosystem):
             click.echo(f"  {click.style(pkg_name, fg='red', bold=True)}")
             for ver in versions:
                 click.echo(f"    └─ {ver}")
@@ -539,10 +625,11 @@ def _print_packages_formatted(threat_db):
 @threat_db_cli.command(name="validate", help="Validate threat CSV file format")
 @click.option(
     "--file",
-    "file_path",
+    "file_paths",
     type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=str),
     required=True,
-    help="Path to threat CSV file to validate"
+    multiple=True,
+    help="Path to threat CSV file to validate (can be specified multiple times)"
 )
 @click.option(
     "--strict",
@@ -554,7 +641,7 @@ def _print_packages_formatted(threat_db):
     is_flag=True,
     help="Show all warnings and detailed information"
 )
-def validate_threat_db(file_path: str, strict: bool, verbose: bool):
+def validate_threat_db(file_paths: Tuple[str, ...], strict: bool, verbose: bool):
     """
     Validate threat database CSV file
 
@@ -569,10 +656,14 @@ def validate_threat_db(file_path: str, strict: bool, verbose: bool):
         package-scan threat-db validate --file threats/sha1-Hulud.csv
         package-scan threat-db validate --file custom-threats.csv --strict
         package-scan threat-db validate --file threats.csv --verbose
+        package-scan threat-db validate --file npm.csv --file pip.csv
     """
-    from package_scan.core import validate_threat_file
+    from package_scan.core import validate_threat_file, validate_threat_files
 
-    success = validate_threat_file(file_path, strict=strict, verbose=verbose)
+    if len(file_paths) == 1:
+        success = validate_threat_file(file_paths[0], strict=strict, verbose=verbose)
+    else:
+        success = validate_threat_files(file_paths, strict=strict, verbose=verbose)
     sys.exit(0 if success else 1)
 
 
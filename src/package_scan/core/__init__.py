@@ -1,10 +1,11 @@
 """Core components for multi-ecosystem threat scanning"""
 
+from importlib import import_module
+
 from .models import Finding
 from .report_engine import ReportEngine
 from .threat_database import ThreatDatabase
 from .threat_metadata import ThreatMetadata, parse_threat_metadata
-from .threat_validator import ThreatValidator, validate_threat_file
 
 __all__ = [
     'Finding',
@@ -14,4 +15,28 @@ __all__ = [
     'parse_threat_metadata',
     'ThreatValidator',
     'validate_threat_file',
+    'validate_threat_files',
 ]
+
+# Components only needed by `threat-db validate`, imported on first access
+_LAZY_EXPORTS = {
+    'ThreatValidator': '.threat_validator',
+    'validate_threat_file': '.threat_validator',
+    'validate_threat_files': '.threat_validator',
+}
+
+
+def __getattr__(name):
+    """Import lazily exported components on first use (PEP 562)"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily exported names in dir() and tab completion"""
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,19 @@
 """Data models for threat scanning findings"""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
 
-@dataclass
+# Use __slots__ for high-volume dataclasses where supported (Python 3.10+).
+# Slotted instances have no per-object __dict__, which keeps large scans lean.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Legacy npm finding keys that are carried over into Finding.metadata
+_LEGACY_METADATA_KEYS = ('lockfile_type', 'location', 'package_path', 'included_versions')
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Finding:
     """Standardized finding structure across all ecosystems"""
 
@@ -25,6 +34,10 @@ class Finding:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
+        declared_spec = self.declared_spec
+        dependency_type = self.dependency_type
+        metadata = self.metadata
+
         result = {
             'ecosystem': self.ecosystem,
             'finding_type': self.finding_type,
@@ -34,15 +47,15 @@ class Finding:
             'match_type': self.match_type,
         }
 
-        if self.declared_spec:
-            result['declared_spec'] = self.declared_spec
+        if declared_spec:
+            result['declared_spec'] = declared_spec
 
-        if self.dependency_type:
-            result['dependency_type'] = self.dependency_type
+        if dependency_type:
+            result['dependency_type'] = dependency_type
 
         # Add any ecosystem-specific metadata
-        if self.metadata:
-            result['metadata'] = self.metadata
+        if metadata:
+            result['metadata'] = metadata
 
         return result
 
@@ -66,16 +79,8 @@ class Finding:
 
         finding_type = type_mapping.get(legacy.get('type'), 'unknown')
 
-        # Build metadata
-        metadata = {}
-        if 'lockfile_type' in legacy:
-            metadata['lockfile_type'] = legacy['lockfile_type']
-        if 'location' in legacy:
-            metadata['location'] = legacy['location']
-        if 'package_path' in legacy:
-            metadata['package_path'] = legacy['package_path']
-        if 'included_versions' in legacy:
-            metadata['included_versions'] = legacy['included_versions']
+        # Build metadata from whichever legacy keys are present
+        metadata = {key: legacy[key] for key in _LEGACY_METADATA_KEYS if key in legacy}
 
         return cls(
             ecosystem='npm',
@@ -83,7 +88,9 @@ class Finding:
             file_path=legacy.get('file', legacy.get('location', '')),
             package_name=legacy['package'],
             version=legacy['version'],
-            match_type=legacy.get('match_type', 'exact'),
+            # Legacy dicts may come from parsed JSON; intern so report
+            # grouping compares by identity like adapter-built findings
+            match_type=sys.intern(legacy.get('match_type', 'exact')),
             declared_spec=legacy.get('version_spec'),
             dependency_type=legacy.get('dependency_type'),
             metadata=metadata
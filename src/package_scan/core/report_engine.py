@@ -1,15 +1,116 @@
 """Report generation engine for multi-ecosystem threat scanning"""
 
+import io
 import json
 import os
+import sys
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Dict, List, Optional, TextIO
 
 import click
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup (pip install orjson); fall back to stdlib json
+    orjson = None
+
 from .models import Finding
 
+# Finding fields (top-level or in metadata) holding paths to format for output
+_PATH_FIELDS = ('file_path', 'location', 'package_path')
+
+# Static styled fragments of the console report, built once at import
+_DIVIDER_WHITE = click.style("=" * 80, fg='white', bold=True)
+_DIVIDER_CYAN = click.style("─" * 80, fg='cyan')
+_DIVIDER_YELLOW = click.style("─" * 80, fg='yellow')
+_DIVIDER_RED = click.style("─" * 80, fg='red')
+_REPORT_HEADER = f"\n{_DIVIDER_WHITE}\n" + click.style("SCAN REPORT", fg='white', bold=True) + f"\n{_DIVIDER_WHITE}\n"
+_NO_FINDINGS_MESSAGE = (
+    click.style("\n✓ No compromised packages found!", fg='green', bold=True) + "\n" +
+    click.style("   Your project appears clean.\n", fg='green') + "\n"
+)
+_THREAT_DETECTED_LABEL = click.style("\n⚠️  THREAT DETECTED: ", fg='red', bold=True)
+_TOTAL_FINDINGS_LABEL = click.style("Total findings: ", fg='white', bold=True)
+_SUMMARY_HEADER = "\n" + click.style("📊 Summary:", fg='cyan', bold=True) + "\n"
+_BY_ECOSYSTEM_HEADER = "\n   " + click.style("By Ecosystem:", fg='cyan', bold=True) + "\n"
+_NEXT_STEPS = "\n" + click.style("💡 Next Steps:", fg='cyan', bold=True) + "\n" + "".join(
+    click.style(f"   {number}.", fg='cyan') + f" {step}\n"
+    for number, step in enumerate([
+        "Review all findings above",
+        "Check security advisories for safe versions",
+        "Verify replacements are not compromised",
+        "Update manifests to exclude compromised versions",
+        "Regenerate lockfiles after changes",
+    ], start=1)
+)
+
+# Reused for every finding when streaming; json.dumps with non-default
+# options would construct a new encoder on each call
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
+@lru_cache(maxsize=None)
+def _get_path_prefix() -> Optional[str]:
+    """
+    Read SCAN_PATH_PREFIX once per process
+
+    Call _get_path_prefix.cache_clear() after changing the variable.
+
+    Returns:
+        The configured path prefix, or None if unset
+    """
+    return os.environ.get('SCAN_PATH_PREFIX')
+
+
+def _plain_style(text: str, **kwargs) -> str:
+    """Stand-in for click.style when output will not be colored"""
+    return text
+
+
+def _color_enabled() -> bool:
+    """
+    Check whether click.echo will keep ANSI styling on stdout
+
+    Returns:
+        True if the click context forces color or stdout is a terminal
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and ctx.color is not None:
+        return ctx.color
+    isatty = getattr(sys.stdout, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+def _dumps_json(value) -> bytes:
+    """
+    Serialize a value to indented JSON
+
+    Uses orjson when installed (several times faster on large reports),
+    otherwise the stdlib json module with the same 2-space layout. Output
+    matches json.dump's default ensure_ascii=True: orjson always writes
+    non-ASCII characters as raw UTF-8, so those values go through the
+    stdlib encoder to keep their \\uXXXX escapes.
+
+    Args:
+        value: JSON-compatible value to serialize
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        if encoded.isascii():
+            return encoded
+    return _JSON_ENCODER.encode(value).encode('utf-8')
+
+
+def _dumps_nested(value, depth: int) -> bytes:
+    """Serialize a value for embedding at the given indentation depth"""
+    return _dumps_json(value).replace(b'\n', b'\n' + b'  ' * depth)
+
 
 class ReportEngine:
     """
@@ -31,17 +132,26 @@ class ReportEngine:
         self.scan_dir = Path(scan_dir) if scan_dir else None
         # Get path prefix from environment variable (for Docker/CI friendliness)
         # If set to ".", use relative paths; if set to absolute path, replace /workspace with that path
-        self.path_prefix = os.environ.get('SCAN_PATH_PREFIX', None)
+        self.path_prefix = _get_path_prefix()
+        # Resolved once here; _format_path is called for every path of every finding
+        self._scan_dir_abs = self.scan_dir.absolute() if self.scan_dir else None
+        self._prefix_path = Path(self.path_prefix) if self.path_prefix else None
+        self._path_cache: Dict[str, str] = {}
+        self._style = click.style
         self.findings: List[Finding] = []
         self.threats: List[str] = []  # Track which threats were scanned
+        # Findings grouped by ecosystem, built on demand and reset on change
+        self._buckets: Optional[Dict[str, List[Finding]]] = None
 
     def add_finding(self, finding: Finding):
         """Add a single finding"""
         self.findings.append(finding)
+        self._buckets = None
 
     def add_findings(self, findings: List[Finding]):
         """Add multiple findings"""
         self.findings.extend(findings)
+        self._buckets = None
 
     def set_threats(self, threats: List[str]):
         """Set the list of threats that were scanned"""
@@ -51,6 +161,7 @@ class ReportEngine:
         """Clear all findings and threats"""
         self.findings.clear()
         self.threats.clear()
+        self._buckets = None
 
     def get_findings_count(self) -> int:
         """Get total number of findings"""
@@ -58,7 +169,24 @@ class ReportEngine:
 
     def get_ecosystems(self) -> List[str]:
         """Get list of ecosystems with findings"""
-        return sorted(set(f.ecosystem for f in self.findings))
+        return list(self._bucket_by_ecosystem())
+
+    def _bucket_by_ecosystem(self) -> Dict[str, List[Finding]]:
+        """
+        Group findings by ecosystem in a single pass
+
+        The result is cached until findings are added or cleared, so the
+        report and summary methods share one traversal of the findings.
+
+        Returns:
+            Dictionary mapping ecosystem names (sorted) to their findings
+        """
+        if self._buckets is None:
+            buckets = defaultdict(list)
+            for finding in self.findings:
+                buckets[finding.ecosystem].append(finding)
+            self._buckets = {ecosystem: buckets[ecosystem] for ecosystem in sorted(buckets)}
+        return self._buckets
 
     def _format_path(self, path: str) -> str:
         """
@@ -78,24 +206,27 @@ class ReportEngine:
         if not self.path_prefix or not self.scan_dir:
             return path
 
+        # Many findings share a file, so reuse earlier conversions
+        formatted = self._path_cache.get(path)
+        if formatted is not None:
+            return formatted
+
         try:
-            abs_path = Path(path)
-            scan_dir_abs = self.scan_dir.absolute()
+            rel_path = Path(path).relative_to(self._scan_dir_abs)
 
             # If path prefix is ".", use relative paths
             if self.path_prefix == ".":
-                rel_path = abs_path.relative_to(scan_dir_abs)
-                return f"./{rel_path}"
+                formatted = f"./{rel_path}"
+            else:
+                # Otherwise, replace scan_dir with the provided prefix
+                formatted = str(self._prefix_path / rel_path)
 
-            # Otherwise, replace scan_dir with the provided prefix
-            rel_path = abs_path.relative_to(scan_dir_abs)
-            prefix_path = Path(self.path_prefix)
-            new_path = prefix_path / rel_path
-            return str(new_path)
+        except ValueError:
+            # Path is outside scan directory, return as-is
+            formatted = path
 
-        except (ValueError, Exception):
-            # Path is outside scan directory or other error, return as-is
-            return path
+        self._path_cache[path] = formatted
+        return formatted
 
     def _generate_summary(self) -> dict:
         """
@@ -105,146 +236,165 @@ class ReportEngine:
             Dictionary mapping ecosystem names to summary stats
         """
         ecosystem_summary = {}
-        for ecosystem in self.get_ecosystems():
-            ecosystem_findings = [f for f in self.findings if f.ecosystem == ecosystem]
+        for ecosystem, ecosystem_findings in self._bucket_by_ecosystem().items():
+            type_counts = {'manifest': 0, 'lockfile': 0, 'installed': 0}
+            packages = set()
+            for f in ecosystem_findings:
+                if f.finding_type in type_counts:
+                    type_counts[f.finding_type] += 1
+                packages.add(f.package_name)
+
             ecosystem_summary[ecosystem] = {
                 'total': len(ecosystem_findings),
-                'manifest': sum(1 for f in ecosystem_findings if f.finding_type == 'manifest'),
-                'lockfile': sum(1 for f in ecosystem_findings if f.finding_type == 'lockfile'),
-                'installed': sum(1 for f in ecosystem_findings if f.finding_type == 'installed'),
-                'unique_packages': len(set(f.package_name for f in ecosystem_findings))
+                'manifest': type_counts['manifest'],
+                'lockfile': type_counts['lockfile'],
+                'installed': type_counts['installed'],
+                'unique_packages': len(packages)
             }
         return ecosystem_summary
 
     def print_report(self):
-        """Print formatted console report"""
-        click.echo("\n" + click.style("=" * 80, fg='white', bold=True))
-        click.echo(click.style("SCAN REPORT", fg='white', bold=True))
-        click.echo(click.style("=" * 80, fg='white', bold=True))
+        """
+        Print formatted console report
+
+        The report is rendered into a buffer and written with a single
+        click.echo, rather than one terminal write per line.
+        """
+        # click.echo strips ANSI codes when the output is not a terminal, so
+        # skip styling the per-finding text in that case
+        self._style = click.style if _color_enabled() else _plain_style
+
+        out = io.StringIO()
+        self._render_report(out)
+        click.echo(out.getvalue(), nl=False)
+
+    def _render_report(self, out: TextIO):
+        """Render the console report into a text stream"""
+        out.write(_REPORT_HEADER)
 
         # Show which threats were scanned
         if self.threats:
             threat_list = ', '.join(self.threats)
-            click.echo(click.style(f"🔎 Scanned for threats: {threat_list}", fg='cyan', bold=True))
+            out.write(self._style(f"🔎 Scanned for threats: {threat_list}", fg='cyan', bold=True) + "\n")
 
         if not self.findings:
-            click.echo(click.style("\n✓ No compromised packages found!", fg='green', bold=True))
-            click.echo(click.style("   Your project appears clean.\n", fg='green'))
+            out.write(_NO_FINDINGS_MESSAGE)
             return
 
         # Show findings count with high impact
         count = len(self.findings)
-        click.echo(click.style(f"\n⚠️  THREAT DETECTED: ", fg='red', bold=True) +
-                  click.style(f"Found {count} compromised package reference(s)\n", fg='yellow', bold=True))
+        out.write(_THREAT_DETECTED_LABEL +
+                  self._style(f"Found {count} compromised package reference(s)\n", fg='yellow', bold=True) + "\n")
 
         # Group findings by ecosystem
-        ecosystems = self.get_ecosystems()
+        buckets = self._bucket_by_ecosystem()
 
-        if len(ecosystems) > 1:
-            click.echo(click.style(f"📦 Multiple ecosystems affected: {', '.join(ecosystems)}\n", fg='magenta', bold=True))
+        if len(buckets) > 1:
+            out.write(self._style(f"📦 Multiple ecosystems affected: {', '.join(buckets)}\n", fg='magenta', bold=True) + "\n")
 
-        for ecosystem in ecosystems:
-            ecosystem_findings = [f for f in self.findings if f.ecosystem == ecosystem]
-            self._print_ecosystem_report(ecosystem, ecosystem_findings)
+        for ecosystem, ecosystem_findings in buckets.items():
+            self._print_ecosystem_report(out, ecosystem, ecosystem_findings)
 
         # Print overall summary
-        self._print_summary()
+        self._print_summary(out)
 
-    def _print_ecosystem_report(self, ecosystem: str, findings: List[Finding]):
+    def _print_ecosystem_report(self, out: TextIO, ecosystem: str, findings: List[Finding]):
         """Print findings for a specific ecosystem"""
-        click.echo(click.style("─" * 80, fg='cyan'))
-        click.echo(click.style(f"🔍 ECOSYSTEM: {ecosystem.upper()}", fg='cyan', bold=True))
-        click.echo(click.style("─" * 80, fg='cyan'))
-        click.echo(click.style(f"   {len(findings)} finding(s)\n", fg='cyan', dim=True))
+        out.write(_DIVIDER_CYAN + "\n")
+        out.write(self._style(f"🔍 ECOSYSTEM: {ecosystem.upper()}", fg='cyan', bold=True) + "\n")
+        out.write(_DIVIDER_CYAN + "\n")
+        out.write(self._style(f"   {len(findings)} finding(s)\n", fg='cyan', dim=True) + "\n")
 
         # Group by finding type
-        manifest_findings = [f for f in findings if f.finding_type == 'manifest']
-        lockfile_findings = [f for f in findings if f.finding_type == 'lockfile']
-        installed_findings = [f for f in findings if f.finding_type == 'installed']
+        by_type = defaultdict(list)
+        for f in findings:
+            by_type[f.finding_type].append(f)
+        manifest_findings = by_type['manifest']
+        lockfile_findings = by_type['lockfile']
+        installed_findings = by_type['installed']
 
         if manifest_findings:
-            click.echo(click.style("─" * 80, fg='yellow'))
-            click.echo(click.style(f"📄 MANIFEST FILES ({len(manifest_findings)}):", fg='yellow', bold=True))
-            click.echo(click.style("─" * 80, fg='yellow'))
+            out.write(_DIVIDER_YELLOW + "\n")
+            out.write(self._style(f"📄 MANIFEST FILES ({len(manifest_findings)}):", fg='yellow', bold=True) + "\n")
+            out.write(_DIVIDER_YELLOW + "\n")
             for finding in manifest_findings:
-                self._print_finding(finding)
+                self._print_finding(out, finding)
 
         if lockfile_findings:
-            click.echo("\n" + click.style("─" * 80, fg='red'))
-            click.echo(click.style(f"🔒 LOCK FILES ({len(lockfile_findings)}):", fg='red', bold=True))
-            click.echo(click.style("─" * 80, fg='red'))
+            out.write("\n" + _DIVIDER_RED + "\n")
+            out.write(self._style(f"🔒 LOCK FILES ({len(lockfile_findings)}):", fg='red', bold=True) + "\n")
+            out.write(_DIVIDER_RED + "\n")
             for finding in lockfile_findings:
-                self._print_finding(finding)
+                self._print_finding(out, finding)
 
         if installed_findings:
-            click.echo("\n" + click.style("─" * 80, fg='red'))
-            click.echo(click.style(f"📦 INSTALLED PACKAGES ({len(installed_findings)}):", fg='red', bold=True))
-            click.echo(click.style("─" * 80, fg='red'))
+            out.write("\n" + _DIVIDER_RED + "\n")
+            out.write(self._style(f"📦 INSTALLED PACKAGES ({len(installed_findings)}):", fg='red', bold=True) + "\n")
+            out.write(_DIVIDER_RED + "\n")
             for finding in installed_findings:
-                self._print_finding(finding)
+                self._print_finding(out, finding)
 
-        click.echo()  # Extra newline
+        out.write("\n")  # Extra newline
 
-    def _print_finding(self, finding: Finding):
+    def _print_finding(self, out: TextIO, finding: Finding):
         """Print a single finding"""
-        click.echo(f"\n  File: {self._format_path(finding.file_path)}")
-        click.echo(f"  Package: " + click.style(f"{finding.package_name}@{finding.version}", fg='red', bold=True))
+        out.write(f"\n  File: {self._format_path(finding.file_path)}" + "\n")
+        out.write(f"  Package: " + self._style(f"{finding.package_name}@{finding.version}", fg='red', bold=True) + "\n")
 
         if finding.declared_spec:
-            click.echo(f"  Version Spec: {finding.declared_spec}")
+            out.write(f"  Version Spec: {finding.declared_spec}" + "\n")
 
         if finding.dependency_type:
-            click.echo(f"  Dependency Type: {finding.dependency_type}")
+            out.write(f"  Dependency Type: {finding.dependency_type}" + "\n")
 
-        click.echo(f"  Match Type: {finding.match_type}")
+        out.write(f"  Match Type: {finding.match_type}" + "\n")
 
         # Print ecosystem-specific metadata
         if finding.metadata:
             if 'lockfile_type' in finding.metadata:
-                click.echo(f"  Lock File Type: {finding.metadata['lockfile_type']}")
+                out.write(f"  Lock File Type: {finding.metadata['lockfile_type']}" + "\n")
             if 'location' in finding.metadata:
-                click.echo(f"  Location: {self._format_path(finding.metadata['location'])}")
+                out.write(f"  Location: {self._format_path(finding.metadata['location'])}" + "\n")
             if 'package_path' in finding.metadata:
-                click.echo(f"  Path: {self._format_path(finding.metadata['package_path'])}")
+                out.write(f"  Path: {self._format_path(finding.metadata['package_path'])}" + "\n")
 
-    def _print_summary(self):
+    def _print_summary(self, out: TextIO):
         """Print overall summary"""
-        click.echo(click.style("=" * 80, fg='white', bold=True))
-        click.echo(click.style(f"Total findings: ", fg='white', bold=True) +
-                  click.style(f"{len(self.findings)}", fg='red', bold=True))
-        click.echo(click.style("=" * 80, fg='white', bold=True))
-
-        # Calculate statistics
-        exact_count = sum(1 for f in self.findings if f.match_type == 'exact')
-        range_count = sum(1 for f in self.findings if f.match_type == 'range')
-
-        # Group by ecosystem
-        ecosystem_stats = defaultdict(lambda: {'packages': set(), 'findings': 0})
-        for finding in self.findings:
-            ecosystem_stats[finding.ecosystem]['packages'].add(finding.package_name)
-            ecosystem_stats[finding.ecosystem]['findings'] += 1
-
-        click.echo("\n" + click.style("📊 Summary:", fg='cyan', bold=True))
-        click.echo(f"   • Exact version matches: " + click.style(str(exact_count), fg='red', bold=True))
-        click.echo(f"   • Semver range matches: " + click.style(str(range_count), fg='yellow', bold=True))
+        out.write(_DIVIDER_WHITE + "\n")
+        out.write(_TOTAL_FINDINGS_LABEL +
+                  self._style(f"{len(self.findings)}", fg='red', bold=True) + "\n")
+        out.write(_DIVIDER_WHITE + "\n")
+
+        # Calculate statistics in one pass: match types overall, plus
+        # [package names, finding count] per ecosystem
+        exact_count = 0
+        range_count = 0
+        ecosystem_stats = defaultdict(lambda: [set(), 0])
+        for f in self.findings:
+            if f.match_type == 'exact':
+                exact_count += 1
+            elif f.match_type == 'range':
+                range_count += 1
+            stats = ecosystem_stats[f.ecosystem]
+            stats[0].add(f.package_name)
+            stats[1] += 1
+
+        out.write(_SUMMARY_HEADER)
+        out.write(f"   • Exact version matches: " + self._style(str(exact_count), fg='red', bold=True) + "\n")
+        out.write(f"   • Semver range matches: " + self._style(str(range_count), fg='yellow', bold=True) + "\n")
 
         if len(ecosystem_stats) > 1:
-            click.echo(f"\n   " + click.style("By Ecosystem:", fg='cyan', bold=True))
-            for ecosystem in sorted(ecosystem_stats.keys()):
-                stats = ecosystem_stats[ecosystem]
-                click.echo(f"   • {ecosystem}: " +
-                          click.style(f"{len(stats['packages'])} packages, {stats['findings']} findings",
-                                    fg='magenta', bold=True))
+            out.write(_BY_ECOSYSTEM_HEADER)
+            for ecosystem in sorted(ecosystem_stats):
+                packages, finding_count = ecosystem_stats[ecosystem]
+                out.write(f"   • {ecosystem}: " +
+                          self._style(f"{len(packages)} packages, {finding_count} findings",
+                                    fg='magenta', bold=True) + "\n")
 
         # Print next steps guidance
-        click.echo("\n" + click.style("💡 Next Steps:", fg='cyan', bold=True))
-        click.echo(click.style("   1.", fg='cyan') + " Review all findings above")
-        click.echo(click.style("   2.", fg='cyan') + " Check security advisories for safe versions")
-        click.echo(click.style("   3.", fg='cyan') + " Verify replacements are not compromised")
-        click.echo(click.style("   4.", fg='cyan') + " Update manifests to exclude compromised versions")
-        click.echo(click.style("   5.", fg='cyan') + " Regenerate lockfiles after changes")
+        out.write(_NEXT_STEPS)
 
-        click.echo()  # Final newline
+        out.write("\n")  # Final newline
 
     def save_report(self, output_file: str) -> bool:
         """
@@ -259,41 +409,65 @@ class ReportEngine:
             True if saved successfully, False otherwise
         """
         try:
-            # Convert findings to dictionaries
-            findings_data = []
-            for finding in self.findings:
-                finding_dict = finding.to_dict()
-
-                # Convert paths using the same logic as console output
-                for path_field in ['file_path', 'location', 'package_path']:
-                    if path_field in finding_dict:
-                        finding_dict[path_field] = self._format_path(finding_dict[path_field])
-
-                    # Also check metadata
-                    if path_field in finding_dict.get('metadata', {}):
-                        finding_dict['metadata'][path_field] = self._format_path(
-                            finding_dict['metadata'][path_field]
-                        )
-
-                findings_data.append(finding_dict)
-
-            # Build report structure
-            report = {
-                'total_findings': len(self.findings),
-                'threats': self.threats,
-                'ecosystems': self.get_ecosystems(),
-                'findings': findings_data
-            }
-
-            # Add ecosystem summary
-            report['summary'] = self._generate_summary()
-
-            # Write to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2)
+            with open(output_file, 'wb') as f:
+                self.write_report(f)
 
             return True
 
         except Exception as e:
             click.echo(click.style(f"✗ Error saving report: {e}", fg='red', bold=True), err=True)
             return False
+
+    def write_report(self, stream: BinaryIO):
+        """
+        Stream the JSON report to a binary file object
+
+        Findings are serialized and written one at a time, so the full list of
+        finding dicts and the complete JSON document are never held in memory
+        together. The output is identical to serializing the whole report at once.
+
+        Args:
+            stream: Binary file-like object to write to
+        """
+        header = {
+            'total_findings': len(self.findings),
+            'threats': self.threats,
+            'ecosystems': self.get_ecosystems(),
+        }
+
+        stream.write(b'{')
+        for key, value in header.items():
+            stream.write(b'\n  "' + key.encode('utf-8') + b'": ' + _dumps_nested(value, 1) + b',')
+
+        stream.write(b'\n  "findings": [')
+        separator = b'\n    '
+        for finding in self.findings:
+            stream.write(separator + _dumps_nested(self._report_finding_dict(finding), 2))
+            separator = b',\n    '
+        stream.write(b'\n  ]' if self.findings else b']')
+
+        stream.write(b',\n  "summary": ' + _dumps_nested(self._generate_summary(), 1) + b'\n}')
+
+    def _report_finding_dict(self, finding: Finding) -> dict:
+        """
+        Convert a finding to its JSON report dict, formatting paths for output
+
+        Args:
+            finding: Finding to convert
+
+        Returns:
+            Finding dictionary with display-formatted paths
+        """
+        finding_dict = finding.to_dict()
+        metadata = finding_dict.get('metadata')
+
+        # Convert paths using the same logic as console output
+        for path_field in _PATH_FIELDS:
+            if path_field in finding_dict:
+                finding_dict[path_field] = self._format_path(finding_dict[path_field])
+
+            # Also check metadata
+            if metadata and path_field in metadata:
+                metadata[path_field] = self._format_path(metadata[path_field])
+
+        return finding_dict
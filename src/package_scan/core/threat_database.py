@@ -1,13 +1,35 @@
 """Threat database management for multi-ecosystem scanning"""
 
-import csv
+import sys
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Set, Optional, List
+from typing import AbstractSet, Dict, FrozenSet, Iterable, Iterator, Set, Optional, List, Tuple
 
 import click
 
-from .threat_metadata import get_csv_reader_without_comments
+from .threat_metadata import build_threat_stats, iter_csv_rows_without_comments
+
+# Shared result for lookups that miss, so they don't allocate a new set
+_NO_VERSIONS: FrozenSet[str] = frozenset()
+
+# Skipped rows listed individually in the end-of-file load warning
+_MAX_ROW_WARNINGS = 5
+
+
+class _EcosystemView:
+    """Lookups against a single ecosystem's threats, see ThreatDatabase.bind_ecosystem"""
+
+    __slots__ = ('_packages',)
+
+    def __init__(self, packages: Dict[str, Set[str]]):
+        self._packages = packages
+
+    def is_compromised(self, package_name: str, version: str) -> bool:
+        versions = self._packages.get(package_name)
+        return versions is not None and version in versions
+
+    def get_compromised_versions(self, package_name: str) -> AbstractSet[str]:
+        return self._packages.get(package_name, _NO_VERSIONS)
 
 
 class ThreatDatabase:
@@ -31,11 +53,26 @@ class ThreatDatabase:
         self.threats_dir = Path(threats_dir)
         self.loaded_threats: List[str] = []  # Track loaded threat names
         # Structure: {ecosystem: {package_name: set(versions)}}
-        self.threats: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self.threats: Dict[str, Dict[str, Set[str]]] = {}
         self._is_loaded = False
+        self._collect_stats = False
+        self._ecosystem_filter: Optional[FrozenSet[str]] = None
+        # Per-ecosystem (name, sorted versions) listings, built on first use
+        self._sorted_packages: Dict[str, List[Tuple[str, List[str]]]] = {}
+        # Per-ecosystem flat (name, version) sets for is_compromised, built on first use
+        self._pairs: Dict[str, FrozenSet[Tuple[str, str]]] = {}
+        # Per-ecosystem (package count, version count), built on first use
+        self._counts: Optional[Dict[str, Tuple[int, int]]] = None
+        # Skipped-row messages for the file being loaded, reported once at the end
+        self._load_warnings: List[str] = []
+        # Per-threat statistics (ThreatMetadata.stats format), only gathered
+        # when load_threats is called with collect_stats=True
+        self.file_stats: Dict[str, Dict] = {}
 
     def load_threats(self, threat_names: Optional[List[str]] = None,
-                    csv_file: Optional[str] = None) -> bool:
+                    csv_file: Optional[str] = None,
+                    collect_stats: bool = False,
+                    ecosystems: Optional[Iterable[str]] = None) -> bool:
         """
         Load threats by name or from custom CSV
 
@@ -45,10 +82,24 @@ class ThreatDatabase:
 
             csv_file: Path to custom CSV file (overrides threat_names).
 
+            collect_stats: Also record per-threat statistics in file_stats
+                while the rows are read, so callers that report them don't
+                have to parse each file a second time.
+
+            ecosystems: Only load rows for these ecosystems (case-insensitive).
+                If None, rows for every ecosystem are loaded.
+
         Returns:
             True if at least one threat loaded successfully, False otherwise
         """
         success = False
+        self._collect_stats = collect_stats
+        self._ecosystem_filter = (
+            frozenset(ecosystem.lower() for ecosystem in ecosystems) if ecosystems is not None else None
+        )
+        self._sorted_packages.clear()
+        self._pairs.clear()
+        self._counts = None
 
         if csv_file:
             # Load custom CSV file
@@ -75,6 +126,9 @@ class ThreatDatabase:
                     fg='red', bold=True), err=True)
                 return False
 
+            # Loaded sequentially on purpose: parsing is CPU-bound under the
+            # GIL and reading is a small share of the time, so worker
+            # threads only add contention
             for csv_path in csv_files:
                 threat_name = csv_path.stem
                 if self._load_csv(csv_path, threat_name=threat_name):
@@ -102,9 +156,8 @@ class ThreatDatabase:
 
         try:
             # Use comment-filtered reader to skip # lines
-            csv_content = get_csv_reader_without_comments(csv_path)
-            reader = csv.DictReader(csv_content)
-            headers = reader.fieldnames
+            reader = iter_csv_rows_without_comments(csv_path)
+            headers = next(reader, None)
 
             if not headers:
                 click.echo(click.style(f"✗ Error: CSV file has no headers: {csv_path}", fg='red', bold=True), err=True)
@@ -119,7 +172,13 @@ class ThreatDatabase:
                     fg='red', bold=True), err=True)
                 return False
 
-            self._load_multi_ecosystem_format(reader)
+            stats_packages = defaultdict(set) if self._collect_stats else None
+            self._load_warnings = []
+            stats_rows = self._load_multi_ecosystem_format(reader, headers, stats_packages)
+            if self._load_warnings:
+                self._print_load_warnings(csv_path)
+            if stats_packages is not None:
+                self.file_stats[threat_name] = build_threat_stats(stats_packages, stats_rows)
 
             self.loaded_threats.append(threat_name)
             return True
@@ -131,29 +190,111 @@ class ThreatDatabase:
             click.echo(click.style(f"✗ Error loading {csv_path}: {e}", fg='red', bold=True), err=True)
             return False
 
-    def _load_multi_ecosystem_format(self, reader):
-        """Load CSV in multi-ecosystem format"""
+    def _load_multi_ecosystem_format(self, reader, headers: List[str],
+                                     stats_packages: Optional[Dict[str, Set[str]]] = None) -> int:
+        """
+        Load CSV in multi-ecosystem format
+
+        Rows are plain lists indexed by column position, resolved once from
+        the header row, rather than a dict built per row.
+
+        Args:
+            reader: Row iterator positioned after the header row
+            headers: Header row of the CSV file
+            stats_packages: Optional mapping to collect each ecosystem's
+                package names into, for statistics. Rows are counted as
+                ThreatMetadata.compute_stats counts them: every row with an
+                ecosystem and a name, including rows skipped for a missing
+                version or by the ecosystem filter.
+
+        Returns:
+            Number of rows counted into stats_packages (0 when it is None)
+        """
+        eco_idx = headers.index('ecosystem')
+        name_idx = headers.index('name')
+        ver_idx = headers.index('version')
+        min_len = max(eco_idx, name_idx, ver_idx) + 1
+        stats_min_len = max(eco_idx, name_idx) + 1
+        threats = self.threats
+        ecosystem_filter = self._ecosystem_filter
+        intern = sys.intern
+        warnings = self._load_warnings
+        stats_rows = 0
+        # Raw ecosystem cell -> (normalized name, its package dict). Feeds use
+        # a handful of distinct ecosystem values, so normalizing each once
+        # replaces strip/lower/intern and the outer dict lookup on every row.
+        # Ecosystems excluded by the filter get no package dict.
+        ecosystem_slots: Dict[str, Tuple[str, Dict[str, Set[str]]]] = {}
+
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is line 1)
-            try:
-                ecosystem = row['ecosystem'].strip().lower()
-                name = row['name'].strip()
-                version = row['version'].strip()
+            if len(row) < min_len:
+                missing = next(h for h in ('ecosystem', 'name', 'version') if headers.index(h) >= len(row))
+                warnings.append(f"row {row_num} with missing field {missing!r}: {dict(zip(headers, row))}")
+                if stats_packages is not None and len(row) >= stats_min_len:
+                    ecosystem = row[eco_idx].strip().lower()
+                    name = row[name_idx].strip()
+                    if ecosystem and name:
+                        stats_packages[ecosystem].add(name)
+                        stats_rows += 1
+                continue
 
-                if not ecosystem or not name or not version:
-                    click.echo(click.style(
-                        f"⚠️  Warning: Skipping row {row_num} with empty fields: {row}",
-                        fg='yellow'), err=True)
-                    continue
+            raw_ecosystem = row[eco_idx]
+            slot = ecosystem_slots.get(raw_ecosystem)
+            if slot is None:
+                ecosystem = intern(raw_ecosystem.strip().lower())
+                wanted = ecosystem and (ecosystem_filter is None or ecosystem in ecosystem_filter)
+                slot = (ecosystem, threats.setdefault(ecosystem, {}) if wanted else None)
+                ecosystem_slots[raw_ecosystem] = slot
+            ecosystem, packages = slot
+
+            if packages is None and ecosystem:
+                # Ecosystem not requested
+                if stats_packages is not None:
+                    name = row[name_idx].strip()
+                    if name:
+                        stats_packages[ecosystem].add(name)
+                        stats_rows += 1
+                continue
 
-                self.threats[ecosystem][name].add(version)
+            # Version strings like '1.0.0' recur across many packages and would
+            # otherwise be stored once per package
+            name = row[name_idx].strip()
+            version = intern(row[ver_idx].strip())
 
-            except KeyError as e:
-                click.echo(click.style(
-                    f"⚠️  Warning: Skipping row {row_num} with missing field {e}: {row}",
-                    fg='yellow'), err=True)
+            if stats_packages is not None and ecosystem and name:
+                stats_packages[ecosystem].add(name)
+                stats_rows += 1
+
+            if not ecosystem or not name or not version:
+                warnings.append(f"row {row_num} with empty fields: {dict(zip(headers, row))}")
                 continue
 
-    def get_compromised_versions(self, ecosystem: str, package_name: str) -> Set[str]:
+            versions = packages.get(name)
+            if versions is None:
+                packages[name] = {version}
+            else:
+                versions.add(version)
+
+        return stats_rows
+
+    def _print_load_warnings(self, csv_path: Path):
+        """
+        Report the rows skipped while loading a CSV file
+
+        Printed as one message after the file is read, rather than one styled
+        line per row, so a badly malformed feed doesn't slow the load down.
+
+        Args:
+            csv_path: Path of the CSV file the warnings came from
+        """
+        warnings = self._load_warnings
+        lines = [f"⚠️  Warning: Skipped {len(warnings)} malformed row(s) in {csv_path}"]
+        lines.extend(f"    {warning}" for warning in warnings[:_MAX_ROW_WARNINGS])
+        if len(warnings) > _MAX_ROW_WARNINGS:
+            lines.append(f"    ... and {len(warnings) - _MAX_ROW_WARNINGS} more")
+        click.echo(click.style("\n".join(lines), fg='yellow'), err=True)
+
+    def get_compromised_versions(self, ecosystem: str, package_name: str) -> AbstractSet[str]:
         """
         Get all compromised versions for a specific package in an ecosystem
 
@@ -162,13 +303,15 @@ class ThreatDatabase:
             package_name: Package identifier
 
         Returns:
-            Set of compromised version strings
+            Set of compromised version strings (empty and immutable if none)
         """
         if not self._is_loaded:
-            return set()
+            return _NO_VERSIONS
 
-        ecosystem = ecosystem.lower()
-        return self.threats.get(ecosystem, {}).get(package_name, set())
+        packages = self.threats.get(ecosystem.lower())
+        if packages is None:
+            return _NO_VERSIONS
+        return packages.get(package_name, _NO_VERSIONS)
 
     def is_compromised(self, ecosystem: str, package_name: str, version: str) -> bool:
         """
@@ -182,8 +325,79 @@ class ThreatDatabase:
         Returns:
             True if compromised, False otherwise
         """
-        compromised_versions = self.get_compromised_versions(ecosystem, package_name)
-        return version in compromised_versions
+        if not self._is_loaded:
+            return False
+
+        # A single hash probe on a flat (name, version) set per ecosystem
+        return (package_name, version) in self._compromised_pairs(ecosystem.lower())
+
+    def are_compromised(self, packages: Iterable[Tuple[str, str, str]]) -> List[bool]:
+        """
+        Check many package versions at once
+
+        Equivalent to calling is_compromised for each item, without the
+        per-call overhead.
+
+        Args:
+            packages: Iterable of (ecosystem, package_name, version) tuples
+
+        Returns:
+            List of booleans, True where the package version is compromised
+        """
+        if not self._is_loaded:
+            return [False for _ in packages]
+
+        # Resolve each distinct ecosystem spelling to its pair set once
+        pairs_by_ecosystem: Dict[str, FrozenSet[Tuple[str, str]]] = {}
+        results = []
+        for ecosystem, name, version in packages:
+            pairs = pairs_by_ecosystem.get(ecosystem)
+            if pairs is None:
+                pairs = pairs_by_ecosystem[ecosystem] = self._compromised_pairs(ecosystem.lower())
+            results.append((name, version) in pairs)
+        return results
+
+    def bind_ecosystem(self, ecosystem: str) -> _EcosystemView:
+        """
+        Get a lookup view for one ecosystem
+
+        The ecosystem name is normalized once here instead of on every
+        is_compromised call, for callers checking many packages of the
+        same ecosystem.
+
+        Args:
+            ecosystem: Ecosystem name (npm, maven, pip, gem, etc.)
+
+        Returns:
+            View with is_compromised(package_name, version) and
+            get_compromised_versions(package_name)
+        """
+        if not self._is_loaded:
+            return _EcosystemView({})
+        return _EcosystemView(self.threats.get(ecosystem.lower(), {}))
+
+    def _compromised_pairs(self, ecosystem: str) -> FrozenSet[Tuple[str, str]]:
+        """
+        Get every compromised (name, version) in one ecosystem as a flat set
+
+        Built on first use and reused until the next load_threats call.
+
+        Args:
+            ecosystem: Lowercase ecosystem name
+
+        Returns:
+            Frozenset of (package_name, version) tuples
+        """
+        pairs = self._pairs.get(ecosystem)
+        if pairs is None:
+            packages = self.threats.get(ecosystem, {})
+            pairs = frozenset(
+                (name, version)
+                for name, versions in packages.items()
+                for version in versions
+            )
+            self._pairs[ecosystem] = pairs
+        return pairs
 
     def get_all_packages(self, ecosystem: Optional[str] = None) -> Dict[str, Set[str]]:
         """
@@ -209,6 +423,30 @@ class ThreatDatabase:
                     all_packages[pkg_name].update(versions)
             return dict(all_packages)
 
+    def iter_sorted_packages(self, ecosystem: str) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Iterate packages of an ecosystem in name order, with sorted versions
+
+        The sorted listing is built once per load and reused on later calls.
+
+        Args:
+            ecosystem: Ecosystem name
+
+        Returns:
+            Iterator of (package_name, sorted_versions) tuples
+        """
+        if not self._is_loaded:
+            return iter(())
+
+        ecosystem = ecosystem.lower()
+        listing = self._sorted_packages.get(ecosystem)
+        if listing is None:
+            packages = self.threats.get(ecosystem, {})
+            listing = [(name, sorted(packages[name])) for name in sorted(packages)]
+            self._sorted_packages[ecosystem] = listing
+
+        return iter(listing)
+
     def get_ecosystems(self) -> Set[str]:
         """
         Get all ecosystems present in the threat database
@@ -240,12 +478,12 @@ class ThreatDatabase:
         Returns:
             Number of unique packages
         """
+        counts = self._ecosystem_counts()
         if ecosystem:
-            ecosystem = ecosystem.lower()
-            return len(self.threats.get(ecosystem, {}))
+            return counts.get(ecosystem.lower(), (0, 0))[0]
         else:
             # Total across all ecosystems
-            return sum(len(packages) for packages in self.threats.values())
+            return sum(package_count for package_count, _ in counts.values())
 
     def get_version_count(self, ecosystem: Optional[str] = None) -> int:
         """
@@ -257,16 +495,29 @@ class ThreatDatabase:
         Returns:
             Total number of compromised versions
         """
+        counts = self._ecosystem_counts()
         if ecosystem:
-            ecosystem = ecosystem.lower()
-            eco_threats = self.threats.get(ecosystem, {})
-            return sum(len(versions) for versions in eco_threats.values())
+            return counts.get(ecosystem.lower(), (0, 0))[1]
         else:
             # Total across all ecosystems
-            total = 0
-            for eco_threats in self.threats.values():
-                total += sum(len(versions) for versions in eco_threats.values())
-            return total
+            return sum(version_count for _, version_count in counts.values())
+
+    def _ecosystem_counts(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Get package and version counts per ecosystem
+
+        Counted in one pass over the database and reused until the next
+        load_threats call.
+
+        Returns:
+            Dictionary mapping ecosystem to (package count, version count)
+        """
+        if self._counts is None:
+            self._counts = {
+                ecosystem: (len(packages), sum(len(versions) for versions in packages.values()))
+                for ecosystem, packages in self.threats.items()
+            }
+        return self._counts
 
     def print_summary(self):
         """Print a summary of loaded threats"""
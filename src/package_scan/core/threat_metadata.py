@@ -5,18 +5,14 @@ Parses metadata from CSV comment lines in threat database files.
 """
 
 import csv
-import re
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set
 
 import click
 
 
-# Metadata field pattern: # Field: Value
-METADATA_PATTERN = re.compile(r'^#\s*([^:]+):\s*(.+)$')
-
 # Recommended metadata fields
 RECOMMENDED_FIELDS = {'description', 'source', 'last updated'}
 
@@ -53,38 +49,50 @@ class ThreatMetadata:
         """Check if all recommended fields are present"""
         return len(self.get_missing_recommended_fields()) == 0
 
-    def compute_stats(self):
-        """Compute statistics from the CSV file"""
+    def compute_stats(self, stats: Optional[Dict] = None):
+        """
+        Compute statistics from the CSV file
+
+        Args:
+            stats: Statistics already gathered while the file was loaded
+                (see ThreatDatabase.file_stats). When given, the file is
+                not read again.
+        """
+        if stats is not None:
+            self.stats = stats
+            return
+
         if not self.file_path.exists():
             return
 
         try:
             # Get filtered CSV content (without comments)
             csv_content = get_csv_reader_without_comments(self.file_path)
-            reader = csv.DictReader(csv_content)
+            reader = csv.reader(csv_content)
+            headers = next(reader, None) or []
 
             # Track ecosystems and packages
             ecosystems: Dict[str, Set[str]] = defaultdict(set)
             total_versions = 0
 
-            for row in reader:
-                ecosystem = row.get('ecosystem', '').strip().lower()
-                name = row.get('name', '').strip()
+            # Column positions are resolved once from the header row
+            if 'ecosystem' in headers and 'name' in headers:
+                eco_idx = headers.index('ecosystem')
+                name_idx = headers.index('name')
+                min_len = max(eco_idx, name_idx) + 1
 
-                if ecosystem and name:
-                    ecosystems[ecosystem].add(name)
-                    total_versions += 1
+                for row in reader:
+                    if len(row) < min_len:
+                        continue
+                    ecosystem = row[eco_idx].strip().lower()
+                    name = row[name_idx].strip()
+
+                    if ecosystem and name:
+                        ecosystems[ecosystem].add(name)
+                        total_versions += 1
 
             # Compute summary statistics
-            self.stats = {
-                'total_versions': total_versions,
-                'total_packages': sum(len(packages) for packages in ecosystems.values()),
-                'ecosystems': sorted(ecosystems.keys()),
-                'ecosystem_details': {
-                    eco: {'packages': len(packages), 'package_names': sorted(packages)}
-                    for eco, packages in ecosystems.items()
-                }
-            }
+            self.stats = build_threat_stats(ecosystems, total_versions)
 
         except Exception:
             # If we can't compute stats, just leave them empty
@@ -146,6 +154,28 @@ class ThreatMetadata:
         click.echo(click.style("=" * 80, fg='cyan', bold=True))
 
 
+def build_threat_stats(ecosystems: Dict[str, Set[str]], total_versions: int) -> Dict:
+    """
+    Build the statistics summary stored in ThreatMetadata.stats
+
+    Args:
+        ecosystems: Mapping of ecosystem name to its package names
+        total_versions: Number of package version rows
+
+    Returns:
+        Statistics dictionary
+    """
+    return {
+        'total_versions': total_versions,
+        'total_packages': sum(len(packages) for packages in ecosystems.values()),
+        'ecosystems': sorted(ecosystems.keys()),
+        'ecosystem_details': {
+            eco: {'packages': len(packages), 'package_names': sorted(packages)}
+            for eco, packages in ecosystems.items()
+        }
+    }
+
+
 def parse_threat_metadata(file_path: Path) -> ThreatMetadata:
     """
     Parse metadata from threat CSV file
@@ -180,12 +210,11 @@ def parse_threat_metadata(file_path: Path) -> ThreatMetadata:
                 # Store all comment lines
                 metadata.comment_lines.append(line)
 
-                # Try to parse as metadata field
-                match = METADATA_PATTERN.match(line)
-                if match:
-                    field_name = match.group(1).strip()
-                    field_value = match.group(2).strip()
-                    metadata.metadata[field_name] = field_value
+                # Try to parse as metadata field: "# Field: Value"
+                field_name, sep, field_value = line[1:].partition(':')
+                field_value = field_value.strip()
+                if sep and field_name and field_value:
+                    metadata.metadata[field_name.strip()] = field_value
 
     except Exception as e:
         click.echo(click.style(
@@ -216,23 +245,46 @@ def filter_csv_comments(lines: List[str]) -> List[str]:
     return filtered
 
 
-def get_csv_reader_without_comments(file_path: Path):
+def get_csv_reader_without_comments(file_path: Path) -> Iterator[str]:
     """
     Get CSV reader that automatically skips comment lines
 
+    Lines are streamed from the file as they are consumed rather than read
+    into memory up front.
+
     Args:
         file_path: Path to CSV file
 
     Returns:
-        File object with comments filtered out, ready for csv.DictReader
+        Iterator of non-comment lines, ready for csv.reader or csv.DictReader
+    """
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        for line in f:
+            stripped = line.lstrip()
+            # Skip comment lines and empty lines, as filter_csv_comments does
+            if stripped and not stripped.startswith('#'):
+                yield line
+
+
+def iter_csv_rows_without_comments(file_path: Path) -> Iterator[List[str]]:
     """
-    import io
+    Iterate the rows of a CSV file, skipping comment and blank lines
+
+    Threat feeds are plain comma-separated values, so when the file has no
+    quote characters each line is split on commas directly instead of going
+    through the csv module's parser; files with quoting use csv.reader.
 
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        Iterator of rows as lists of field strings, header row first
+    """
     with open(file_path, 'r', encoding='utf-8-sig') as f:
-        lines = f.readlines()
+        content = f.read()
 
-    # Filter out comments
-    filtered_lines = filter_csv_comments(lines)
+    lines = [line for line in content.split('\n') if line.strip() and not line.lstrip().startswith('#')]
 
-    # Return as file-like object
-    return io.StringIO(''.join(filtered_lines))
+    if '"' in content:
+        return csv.reader(lines)
+    return (line.split(',') for line in lines)
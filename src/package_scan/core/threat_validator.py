@@ -6,19 +6,27 @@ This prevents distribution of malformed threat CSVs that could cause scanning fa
 """
 
 import csv
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional
 
 import click
 
+from .models import DATACLASS_SLOTS
 from .threat_metadata import get_csv_reader_without_comments, parse_threat_metadata
 
 
 # Known ecosystems (expandable as new adapters are added)
 KNOWN_ECOSYSTEMS = {'npm', 'maven', 'pip', 'gem'}
 
+# Known ecosystems as listed in unknown-ecosystem messages
+_KNOWN_ECOSYSTEMS_TEXT = ', '.join(sorted(KNOWN_ECOSYSTEMS))
+
 # Required CSV headers
 REQUIRED_HEADERS = {'ecosystem', 'name', 'version'}
 
@@ -28,8 +36,21 @@ VERSION_PATTERN = re.compile(r'^[0-9a-zA-Z.\-_+]+$')
 # Maven package name pattern (groupId:artifactId)
 MAVEN_PACKAGE_PATTERN = re.compile(r'^[a-zA-Z0-9._-]+:[a-zA-Z0-9._-]+$')
 
+# Duplicate rows reported individually; any beyond this are summarized
+MAX_DUPLICATE_WARNINGS = 100
 
-@dataclass
+# Longest field value kept verbatim in a validation message
+MAX_VALUE_PREVIEW = 64
+
+
+def _preview(value: Optional[str]) -> Optional[str]:
+    """Clip a field value for display, so huge values aren't kept per error"""
+    if value is not None and len(value) > MAX_VALUE_PREVIEW:
+        return value[:MAX_VALUE_PREVIEW] + '…'
+    return value
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ValidationError:
     """Represents a validation error with context"""
     line_number: int
@@ -56,7 +77,7 @@ class ValidationResult:
             severity='error',
             message=message,
             field=field,
-            value=value
+            value=_preview(value)
         ))
         self.is_valid = False
 
@@ -67,7 +88,7 @@ class ValidationResult:
             severity='warning',
             message=message,
             field=field,
-            value=value
+            value=_preview(value)
         ))
 
     def has_errors(self) -> bool:
@@ -149,8 +170,8 @@ class ThreatValidator:
         try:
             # Use comment-filtered reader to skip # lines
             csv_content = get_csv_reader_without_comments(file_path)
-            reader = csv.DictReader(csv_content)
-            headers = reader.fieldnames
+            reader = csv.reader(csv_content)
+            headers = next(reader, None)
 
             if not headers:
                 result.add_error(1, "No headers found in CSV file")
@@ -169,7 +190,7 @@ class ThreatValidator:
                 return result
 
             # Validate rows
-            self._validate_rows(reader, result)
+            self._validate_rows(reader, headers, result)
 
         except UnicodeDecodeError as e:
             result.add_error(0, f"File encoding error: {e}")
@@ -195,48 +216,76 @@ class ThreatValidator:
         else:
             return 'invalid'
 
-    def _validate_rows(self, reader: csv.DictReader, result: ValidationResult):
+    def _validate_rows(self, reader: Iterator[List[str]], headers: List[str], result: ValidationResult):
         """
         Validate all rows in CSV
 
+        Fields are read by column position, resolved once from the header
+        row, rather than through a dict built per row. Fields missing from
+        short rows are treated as empty.
+
         Args:
-            reader: CSV DictReader
+            reader: CSV row reader positioned after the header row
+            headers: Header row of the CSV file
             result: ValidationResult to populate
         """
+        eco_idx = headers.index('ecosystem')
+        name_idx = headers.index('name')
+        ver_idx = headers.index('version')
+        min_len = max(eco_idx, name_idx, ver_idx) + 1
         seen_entries: Set[Tuple[str, str, str]] = set()
         ecosystems: Set[str] = set()
-        packages: Set[str] = set()
+        packages: Set[Tuple[str, str]] = set()
         total_rows = 0
         valid_rows = 0
+        duplicate_rows = 0
+        # Bound once, these are looked up for every row
+        version_match = VERSION_PATTERN.match
+        known_ecosystems = KNOWN_ECOSYSTEMS
+        strict_ecosystems = self.strict_ecosystems
+        add_entry = seen_entries.add
+        # Versions like '1.0.0' recur across many packages; interning them
+        # keeps one copy alive in seen_entries instead of one per row
+        intern = sys.intern
+        # Raw ecosystem cell -> normalized name; feeds use only a few values
+        ecosystem_names: Dict[str, str] = {}
 
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is line 1)
             total_rows += 1
             row_valid = True
 
             # Extract fields
-            ecosystem = row.get('ecosystem', '').strip().lower()
-            name = row.get('name', '').strip()
-            version = row.get('version', '').strip()
+            if len(row) < min_len:
+                row = row + [''] * (min_len - len(row))
+            raw_ecosystem = row[eco_idx]
+            ecosystem = ecosystem_names.get(raw_ecosystem)
+            if ecosystem is None:
+                ecosystem = ecosystem_names[raw_ecosystem] = raw_ecosystem.strip().lower()
+            name = row[name_idx].strip()
+            version = intern(row[ver_idx].strip())
 
             # Validate ecosystem
             if not ecosystem:
                 result.add_error(row_num, "Empty ecosystem field", field='ecosystem')
                 row_valid = False
-            elif self.strict_ecosystems and ecosystem not in KNOWN_ECOSYSTEMS:
-                result.add_error(
-                    row_num,
-                    f"Unknown ecosystem: '{ecosystem}'. Known: {', '.join(sorted(KNOWN_ECOSYSTEMS))}",
-                    field='ecosystem',
-                    value=ecosystem
-                )
-                row_valid = False
-            elif ecosystem not in KNOWN_ECOSYSTEMS:
-                result.add_warning(
-                    row_num,
-                    f"Unknown ecosystem: '{ecosystem}'. Known: {', '.join(sorted(KNOWN_ECOSYSTEMS))}",
-                    field='ecosystem',
-                    value=ecosystem
-                )
+            elif ecosystem not in known_ecosystems:
+                # Strictness only matters for unknown ecosystems, so known
+                # ones pass with a single membership test
+                if strict_ecosystems:
+                    result.add_error(
+                        row_num,
+                        f"Unknown ecosystem: '{_preview(ecosystem)}'. Known: {_KNOWN_ECOSYSTEMS_TEXT}",
+                        field='ecosystem',
+                        value=ecosystem
+                    )
+                    row_valid = False
+                else:
+                    result.add_warning(
+                        row_num,
+                        f"Unknown ecosystem: '{_preview(ecosystem)}'. Known: {_KNOWN_ECOSYSTEMS_TEXT}",
+                        field='ecosystem',
+                        value=ecosystem
+                    )
 
             # Validate package name
             if not name:
@@ -247,7 +296,7 @@ class ThreatValidator:
                 if ecosystem == 'maven' and ':' not in name:
                     result.add_warning(
                         row_num,
-                        f"Maven package should be in 'groupId:artifactId' format: '{name}'",
+                        f"Maven package should be in 'groupId:artifactId' format: '{_preview(name)}'",
                         field='name',
                         value=name
                     )
@@ -256,7 +305,7 @@ class ThreatValidator:
                 if '\n' in name or '\r' in name or '\t' in name:
                     result.add_error(
                         row_num,
-                        f"Package name contains whitespace characters: '{name}'",
+                        f"Package name contains whitespace characters: '{_preview(name)}'",
                         field='name',
                         value=name
                     )
@@ -267,40 +316,51 @@ class ThreatValidator:
                 result.add_error(row_num, "Empty version field", field='version')
                 row_valid = False
             else:
-                # Check version format
-                if not VERSION_PATTERN.match(version):
+                # Check version format; a version matching the pattern has
+                # no whitespace, so only a failed match needs the check below
+                if not version_match(version):
                     result.add_warning(
                         row_num,
-                        f"Version contains unusual characters: '{version}'",
+                        f"Version contains unusual characters: '{_preview(version)}'",
                         field='version',
                         value=version
                     )
 
-                # Check for whitespace
-                if '\n' in version or '\r' in version or '\t' in version:
-                    result.add_error(
-                        row_num,
-                        f"Version contains whitespace characters: '{version}'",
-                        field='version',
-                        value=version
-                    )
-                    row_valid = False
+                    # Check for whitespace
+                    if '\n' in version or '\r' in version or '\t' in version:
+                        result.add_error(
+                            row_num,
+                            f"Version contains whitespace characters: '{_preview(version)}'",
+                            field='version',
+                            value=version
+                        )
+                        row_valid = False
 
             # Check for duplicates
             entry = (ecosystem, name, version)
             if entry in seen_entries:
-                result.add_warning(
-                    row_num,
-                    f"Duplicate entry: ecosystem={ecosystem}, name={name}, version={version}"
-                )
+                duplicate_rows += 1
+                if duplicate_rows <= MAX_DUPLICATE_WARNINGS:
+                    result.add_warning(
+                        row_num,
+                        f"Duplicate entry: ecosystem={_preview(ecosystem)}, name={_preview(name)}, "
+                        f"version={_preview(version)}"
+                    )
             else:
-                seen_entries.add(entry)
+                add_entry(entry)
 
             # Track stats
             if row_valid:
                 valid_rows += 1
                 ecosystems.add(ecosystem)
-                packages.add(f"{ecosystem}:{name}")
+                packages.add((ecosystem, name))
+
+        if duplicate_rows > MAX_DUPLICATE_WARNINGS:
+            result.add_warning(
+                0,
+                f"{duplicate_rows - MAX_DUPLICATE_WARNINGS} more duplicate entries not listed "
+                f"({duplicate_rows} in total)"
+            )
 
         # Store statistics
         result.stats = {
@@ -347,26 +407,12 @@ class ThreatValidator:
         # Show errors
         if result.has_errors():
             click.echo(click.style(f"\n❌ ERRORS ({len(result.errors)}):", fg='red', bold=True))
-            for error in result.errors:
-                line_info = f"Line {error.line_number}" if error.line_number > 0 else "File"
-                field_info = f" [{error.field}]" if error.field else ""
-                value_info = f" = '{error.value}'" if error.value else ""
-                click.echo(click.style(
-                    f"  • {line_info}{field_info}{value_info}: {error.message}",
-                    fg='red'
-                ))
+            click.echo(self._format_records(result.errors, fg='red'))
 
         # Show warnings (if verbose or if no errors)
         if result.has_warnings() and (verbose or not result.has_errors()):
             click.echo(click.style(f"\n⚠️  WARNINGS ({len(result.warnings)}):", fg='yellow', bold=True))
-            for warning in result.warnings:
-                line_info = f"Line {warning.line_number}" if warning.line_number > 0 else "File"
-                field_info = f" [{warning.field}]" if warning.field else ""
-                value_info = f" = '{warning.value}'" if warning.value else ""
-                click.echo(click.style(
-                    f"  • {line_info}{field_info}{value_info}: {warning.message}",
-                    fg='yellow'
-                ))
+            click.echo(self._format_records(result.warnings, fg='yellow'))
 
         # Final result
         click.echo()
@@ -382,6 +428,36 @@ class ThreatValidator:
 
         click.echo(click.style("=" * 80, fg='cyan', bold=True))
 
+    @staticmethod
+    def _format_records(records: List[ValidationError], fg: str) -> str:
+        """
+        Format errors or warnings as one styled line each
+
+        The lines are joined and written with a single echo, rather than one
+        echo per record, which matters for files with thousands of findings.
+
+        Args:
+            records: ValidationErrors to format
+            fg: Text colour for the lines
+
+        Returns:
+            Styled lines joined with newlines
+        """
+        style = click.style
+        lines = []
+        for record in records:
+            line_info = f"Line {record.line_number}" if record.line_number > 0 else "File"
+            field_info = f" [{record.field}]" if record.field else ""
+            value_info = f" = '{record.value}'" if record.value else ""
+            lines.append(style(f"  • {line_info}{field_info}{value_info}: {record.message}", fg=fg))
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=2)
+def _get_validator(strict: bool) -> ThreatValidator:
+    """Shared validator per strictness setting, so batch runs construct one each"""
+    return ThreatValidator(strict_ecosystems=strict)
+
 
 def validate_threat_file(file_path: str, strict: bool = False, verbose: bool = False) -> bool:
     """
@@ -395,7 +471,73 @@ def validate_threat_file(file_path: str, strict: bool = False, verbose: bool = F
     Returns:
         True if validation passed, False otherwise
     """
-    validator = ThreatValidator(strict_ecosystems=strict)
+    validator = _get_validator(bool(strict))
     result = validator.validate_file(Path(file_path))
     validator.print_result(result, verbose=verbose)
     return result.is_valid
+
+
+def _prefetch_files(file_paths: List[str]):
+    """
+    Ask the kernel to start reading files in ahead of validation
+
+    Issues POSIX_FADV_WILLNEED for every file up front, so later files are
+    being read in while earlier ones are validated. A no-op on platforms
+    without posix_fadvise.
+
+    Args:
+        file_paths: Paths to files that are about to be read
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    for file_path in file_paths:
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _validate_path(file_path: str, strict: bool) -> ValidationResult:
+    """Validate one file in a worker process"""
+    return _get_validator(strict).validate_file(Path(file_path))
+
+
+def validate_threat_files(file_paths: Iterable[str], strict: bool = False, verbose: bool = False,
+                          workers: Optional[int] = None) -> bool:
+    """
+    Validate several threat CSV files, in parallel worker processes
+
+    Validation is CPU-bound, so files are spread over a process pool
+    rather than threads. Results are printed in the order given.
+
+    Args:
+        file_paths: Paths to CSV files
+        strict: If True, only allow known ecosystems
+        verbose: If True, show all warnings and details
+        workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        True if every file passed validation, False otherwise
+    """
+    file_paths = list(file_paths)
+    strict = bool(strict)
+    workers = min(len(file_paths), workers or os.cpu_count() or 1)
+    _prefetch_files(file_paths)
+
+    if workers <= 1:
+        results = [_validate_path(file_path, strict) for file_path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_path, file_paths, [strict] * len(file_paths)))
+
+    validator = _get_validator(strict)
+    for result in results:
+        validator.print_result(result, verbose=verbose)
+    return all(result.is_valid for result in results)
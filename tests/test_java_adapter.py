@@ -358,6 +358,31 @@ dependencies {
     assert len(findings) == 3
 
 
+def test_gradle_map_and_string_formats(temp_project_dir, threat_db):
+    """Test Gradle map-format declarations alongside string declarations."""
+    adapter = JavaAdapter(threat_db, Path(temp_project_dir))
+
+    build_gradle = os.path.join(temp_project_dir, 'build.gradle')
+    with open(build_gradle, 'w') as f:
+        f.write('''
+dependencies {
+    compile group: 'commons-collections', name: 'commons-collections', version: '3.2.1'
+    implementation 'org.springframework:spring-core:5.3.0'
+    testImplementation group: 'org.apache.logging.log4j', name: 'log4j-core', version: '2.14.1'
+    api "com.example:safe-lib:1.0.0"
+}
+''')
+
+    findings = adapter.scan_project(Path(temp_project_dir))
+
+    # String declarations are reported first, then map declarations
+    assert [f.package_name for f in findings] == [
+        'org.springframework:spring-core',
+        'commons-collections:commons-collections',
+        'org.apache.logging.log4j:log4j-core',
+    ]
+
+
 def test_no_dependencies_section(temp_project_dir, threat_db):
     """Test handling pom.xml without dependencies section."""
     adapter = JavaAdapter(threat_db, Path(temp_project_dir))
@@ -3,8 +3,11 @@
 import json
 import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import click
 import pytest
 
 from package_scan.adapters.npm_adapter import NpmAdapter
@@ -82,6 +85,116 @@ def test_detect_multiple_projects(temp_project_dir, threat_db):
     assert len(projects) == 3
 
 
+def test_scan_all_projects_merges_in_project_order(temp_project_dir, threat_db, capsys):
+    """Test that projects scanned concurrently are merged in detection order."""
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    packages = ['left-pad', 'lodash', '@scope/package']
+    versions = {'left-pad': '1.3.0', 'lodash': '4.17.20', '@scope/package': '2.0.0'}
+    for idx, package_name in enumerate(packages):
+        proj_dir = os.path.join(temp_project_dir, f'project{idx}')
+        os.makedirs(proj_dir)
+        with open(os.path.join(proj_dir, 'package.json'), 'w') as f:
+            json.dump({'dependencies': {package_name: versions[package_name]}}, f)
+
+    # A malformed manifest is reported without stopping the other scans
+    broken_dir = os.path.join(temp_project_dir, 'project3')
+    os.makedirs(broken_dir)
+    with open(os.path.join(broken_dir, 'package.json'), 'w') as f:
+        f.write('{not json')
+
+    detected = [p.name for p in adapter.detect_projects() if p.name != 'project3']
+    findings = adapter.scan_all_projects()
+
+    assert [f.package_name for f in findings] == [packages[int(name[-1])] for name in detected]
+    assert 'found 4 project(s)' in capsys.readouterr().out
+
+
+def test_scan_all_projects_prints_project_warnings_in_order(temp_project_dir, threat_db, capsys):
+    """Test that warnings from concurrent project scans print in detection order."""
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    for idx in range(3):
+        proj_dir = os.path.join(temp_project_dir, f'project{idx}')
+        os.makedirs(proj_dir)
+        with open(os.path.join(proj_dir, 'package.json'), 'w') as f:
+            f.write('{not json')
+
+    # Make earlier projects finish last
+    detected = adapter.detect_projects()
+    scan_project = adapter.scan_project
+
+    def slow_scan(project_dir):
+        time.sleep(0.02 * (len(detected) - detected.index(project_dir)))
+        return scan_project(project_dir)
+
+    adapter.scan_project = slow_scan
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        adapter.scan_all_projects(executor)
+
+    warned = [line for line in capsys.readouterr().err.splitlines() if 'Invalid JSON' in line]
+    assert warned == [f"⚠️  Warning: Invalid JSON in {p / 'package.json'}" for p in detected]
+
+
+def test_scan_all_projects_uses_shared_executor(temp_project_dir, threat_db):
+    """Test that projects are scanned on a caller-supplied executor, which is left open."""
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    for idx in range(3):
+        proj_dir = os.path.join(temp_project_dir, f'project{idx}')
+        os.makedirs(proj_dir)
+        with open(os.path.join(proj_dir, 'package.json'), 'w') as f:
+            json.dump({'dependencies': {'left-pad': '1.3.0'}}, f)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        findings = adapter.scan_all_projects(executor)
+        # Still usable after the scan
+        assert executor.submit(len, findings).result() == 3
+
+
+def test_scan_all_projects_buffered_collects_output(temp_project_dir, threat_db, capsys):
+    """Test that a buffered scan returns its console output instead of printing it."""
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    with open(os.path.join(temp_project_dir, 'package.json'), 'w') as f:
+        f.write('{not json')
+
+    findings, output = adapter.scan_all_projects_buffered()
+
+    assert findings == []
+    assert capsys.readouterr() == ('', '')
+    assert any('Invalid JSON' in message and err for message, err in output)
+    assert 'found 1 project(s)' in output[0][0]
+
+
+def test_scan_all_projects_buffered_keeps_project_order(temp_project_dir, threat_db):
+    """Test that buffered output from a shared pool follows detection order."""
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    for idx in range(3):
+        proj_dir = os.path.join(temp_project_dir, f'project{idx}')
+        os.makedirs(proj_dir)
+        with open(os.path.join(proj_dir, 'package.json'), 'w') as f:
+            f.write('{not json')
+
+    # Make earlier projects finish last
+    detected = adapter.detect_projects()
+    scan_project = adapter.scan_project
+
+    def slow_scan(project_dir):
+        time.sleep(0.02 * (len(detected) - detected.index(project_dir)))
+        return scan_project(project_dir)
+
+    adapter.scan_project = slow_scan
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        _, output = adapter.scan_all_projects_buffered(executor)
+
+    warned = [message for message, _ in output if 'Invalid JSON' in message]
+    assert [click.unstyle(message) for message in warned] == [
+        f"⚠️  Warning: Invalid JSON in {p / 'package.json'}" for p in detected
+    ]
+
+
 def test_scan_package_json_exact_match(temp_project_dir, threat_db):
     """Test scanning package.json with exact version match."""
     adapter = NpmAdapter(threat_db, Path(temp_project_dir))
@@ -107,6 +220,45 @@ def test_scan_package_json_exact_match(temp_project_dir, threat_db):
     assert findings[0].match_type == 'range'
 
 
+def test_scan_package_json_non_semver_spec(temp_project_dir, threat_db):
+    """Test specs npm semver can't parse fall back to an exact match, every time."""
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    package_json = os.path.join(temp_project_dir, 'package.json')
+    with open(package_json, 'w') as f:
+        json.dump({'name': 'test-project', 'dependencies': {'left-pad': '~>1.3.0'}}, f)
+
+    # Second scan is served from the parsed-spec cache
+    for _ in range(2):
+        findings = adapter.scan_project(Path(temp_project_dir))
+
+        assert len(findings) == 1
+        assert findings[0].version == '1.3.0'
+        assert findings[0].match_type == 'exact'
+
+
+def test_simple_range_bounds_match_npm_spec():
+    """Test that the tuple fast path agrees with NpmSpec for release versions."""
+    from semantic_version import NpmSpec, Version
+    from package_scan.adapters.npm_adapter import _release_tuple, _simple_range_bounds
+
+    parts = ['0', '1', '10']
+    versions = [f'{a}.{b}.{c}' for a in parts for b in parts for c in parts]
+
+    for operator in ['', '^', '~', '>=']:
+        for base in versions:
+            spec = f'{operator}{base}'
+            lower, upper = _simple_range_bounds(spec)
+            for version in versions:
+                release = _release_tuple(version)
+                fast = lower <= release and (upper is None or release < upper)
+                assert fast == (Version(version) in NpmSpec(spec)), (spec, version)
+
+    assert _simple_range_bounds('1.x') is None
+    assert _simple_range_bounds('^1.0.0-beta') is None
+    assert _release_tuple('1.0.0-beta') is None
+
+
 def test_scan_package_json_range_match(temp_project_dir, threat_db):
     """Test scanning package.json with version range."""
     adapter = NpmAdapter(threat_db, Path(temp_project_dir))
@@ -240,6 +392,161 @@ def test_scan_package_lock_json(temp_project_dir, threat_db):
     assert findings[0].finding_type == 'lockfile'
 
 
+def test_package_lock_streaming_matches_json_load(temp_project_dir, threat_db, monkeypatch):
+    """Test the ijson streaming path finds the same packages as json.load."""
+    from package_scan.adapters import npm_adapter
+    if npm_adapter.ijson is None:
+        pytest.skip("ijson with a C backend is not installed")
+
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+    lock_v3 = Path(temp_project_dir) / 'package-lock.json'
+    lock_v3.write_text(json.dumps({
+        'lockfileVersion': 3,
+        'packages': {
+            '': {'name': 'test-project'},
+            'node_modules/left-pad': {'version': '1.3.0'},
+            'node_modules/lodash': {'version': '4.17.21'},
+        }
+    }))
+    lock_v1 = Path(temp_project_dir) / 'v1-lock.json'
+    lock_v1.write_text(json.dumps({
+        'lockfileVersion': 1,
+        'dependencies': {'left-pad': {'version': '1.3.0'}}
+    }))
+
+    streamed = [adapter._scan_package_lock_json(path) for path in (lock_v3, lock_v1)]
+    monkeypatch.setattr(npm_adapter, 'ijson', None)
+    loaded = [adapter._scan_package_lock_json(path) for path in (lock_v3, lock_v1)]
+
+    assert [[f.to_dict() for f in result] for result in streamed] == \
+        [[f.to_dict() for f in result] for result in loaded]
+    assert [len(result) for result in streamed] == [1, 1]
+
+
+def test_package_lock_v1_is_parsed_once(temp_project_dir, threat_db, monkeypatch):
+    """Test v1 lockfiles skip the streaming pass and are parsed only once."""
+    from types import SimpleNamespace
+    from package_scan.adapters import npm_adapter
+
+    streamed, loaded = [], []
+
+    def fake_kvitems(f, prefix):
+        streamed.append(prefix)
+        return json.load(f).get(prefix, {}).items()
+
+    def counting_load_json(file_path):
+        loaded.append(file_path)
+        with open(file_path) as f:
+            return json.load(f)
+
+    monkeypatch.setattr(npm_adapter, 'ijson', SimpleNamespace(kvitems=fake_kvitems, JSONError=ValueError))
+    monkeypatch.setattr(npm_adapter, '_load_json', counting_load_json)
+
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+    lock_v1 = Path(temp_project_dir) / 'package-lock.json'
+    lock_v1.write_text(json.dumps({
+        'name': 'test-project',
+        'lockfileVersion': 1,
+        'dependencies': {'left-pad': {'version': '1.3.0'}}
+    }, indent=2))
+
+    findings = adapter._scan_package_lock_json(lock_v1)
+    assert [f.package_name for f in findings] == ['left-pad']
+    assert streamed == []
+    assert loaded == [lock_v1]
+
+    lock_v3 = Path(temp_project_dir) / 'v3-lock.json'
+    lock_v3.write_text(json.dumps({
+        'lockfileVersion': 3,
+        'packages': {'': {'name': 'test-project'}, 'node_modules/left-pad': {'version': '1.3.0'}}
+    }))
+
+    findings = adapter._scan_package_lock_json(lock_v3)
+    assert [f.package_name for f in findings] == ['left-pad']
+    assert streamed == ['packages']
+    assert loaded == [lock_v1]
+
+
+def test_scan_yarn_lock(temp_project_dir, threat_db):
+    """Test scanning yarn.lock, including scoped packages and comments."""
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    lock_file = os.path.join(temp_project_dir, 'yarn.lock')
+    with open(lock_file, 'w') as f:
+        f.write(
+            '# yarn lockfile v1\n'
+            '# left-pad@1.3.0:\n'
+            '\n'
+            'left-pad@^1.3.0, left-pad@~1.3.0:\n'
+            '  version "1.3.0"\n'
+            '  resolved "https://registry.yarnpkg.com/left-pad/-/left-pad-1.3.0.tgz"\n'
+            '\n'
+            '"@scope/package@^2.0.0":\n'
+            '  version "2.0.0"\n'
+            '  resolved "https://registry.yarnpkg.com/@scope/package/-/package-2.0.0.tgz"\n'
+            '\n'
+            'lodash@^4.17.21:\n'
+            '  version "4.17.21"\n'
+        )
+
+    findings = adapter._scan_yarn_lock(Path(lock_file))
+
+    assert {(f.package_name, f.version) for f in findings} == {('left-pad', '1.3.0'), ('@scope/package', '2.0.0')}
+    assert all(f.metadata['lockfile_type'] == 'yarn.lock' for f in findings)
+
+
+def test_scan_pnpm_lock_yaml(temp_project_dir, threat_db, monkeypatch):
+    """Test scanning pnpm-lock.yaml, skipping the YAML parse for clean files."""
+    yaml = pytest.importorskip('yaml')
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    lock_file = os.path.join(temp_project_dir, 'pnpm-lock.yaml')
+    with open(lock_file, 'w') as f:
+        f.write(
+            'lockfileVersion: 5.4\n'
+            '\n'
+            'packages:\n'
+            '\n'
+            '  /left-pad/1.3.0:\n'
+            '    resolution: {integrity: sha512-abc}\n'
+            '\n'
+            "  '/@scope/package/2.0.0_react@18.0.0':\n"
+            '    resolution: {integrity: sha512-def}\n'
+            '\n'
+            '  /lodash/4.17.21:\n'
+            '    resolution: {integrity: sha512-ghi}\n'
+        )
+
+    findings = adapter._scan_pnpm_lock_yaml(Path(lock_file))
+
+    assert {(f.package_name, f.version) for f in findings} == {('left-pad', '1.3.0'), ('@scope/package', '2.0.0')}
+
+    with open(lock_file, 'w') as f:
+        f.write(
+            'lockfileVersion: 5.4\n'
+            'packages:\n'
+            '  /react/18.0.0:\n'
+            '    resolution: {integrity: sha512-ghi}\n'
+        )
+
+    parsed = []
+    monkeypatch.setattr(yaml, 'load', lambda stream, Loader: parsed.append(stream))
+
+    assert adapter._scan_pnpm_lock_yaml(Path(lock_file)) == []
+    assert parsed == []
+
+
+def test_text_probe_skips_clean_lockfiles(threat_db):
+    """Test the substring probe, which only applies to small compromised sets."""
+    adapter = NpmAdapter(threat_db, Path('.'))
+
+    assert adapter._text_may_mention_compromised('"@scope/package@^2.0.0":\n')
+    assert not adapter._text_may_mention_compromised('react@^18.0.0:\n  version "18.0.0"\n')
+
+    adapter.compromised_packages = {f'pkg-{i}': {'1.0.0'} for i in range(100)}
+    assert adapter._text_may_mention_compromised('react@^18.0.0:\n')
+
+
 def test_scan_package_lock_v1_format(temp_project_dir, threat_db):
     """Test scanning package-lock.json v1 format."""
     adapter = NpmAdapter(threat_db, Path(temp_project_dir))
@@ -262,6 +569,30 @@ def test_scan_package_lock_v1_format(temp_project_dir, threat_db):
     assert findings[0].package_name == 'left-pad'
 
 
+def test_extract_lock_v1_nested_dependencies(threat_db):
+    """Test v1 lockfile extraction order and very deep dependency trees."""
+    import sys
+
+    adapter = NpmAdapter(threat_db, Path('.'))
+
+    packages = adapter._extract_lock_packages({'dependencies': {
+        'a': {'version': '1.0.0', 'dependencies': {'b': {'version': '2.0.0'}}},
+        'c': {'version': '3.0.0'},
+    }})
+    assert list(packages.items()) == [
+        ('a', '1.0.0'), ('a/node_modules/b', '2.0.0'), ('c', '3.0.0')]
+
+    # Nesting deeper than the recursion limit
+    depth = sys.getrecursionlimit() + 100
+    deps = {}
+    level = deps
+    for _ in range(depth):
+        level['pkg'] = {'version': '1.0.0', 'dependencies': {}}
+        level = level['pkg']['dependencies']
+
+    assert len(adapter._extract_lock_packages({'dependencies': deps})) == depth
+
+
 def test_no_duplicate_findings(temp_project_dir, threat_db):
     """Test that same package in manifest and lockfile doesn't create duplicates."""
     adapter = NpmAdapter(threat_db, Path(temp_project_dir))
@@ -291,6 +622,28 @@ def test_no_duplicate_findings(temp_project_dir, threat_db):
     assert finding_types == {'manifest', 'lockfile'}
 
 
+def test_scan_node_modules(temp_project_dir, threat_db):
+    """Test scanning installed packages, including scoped packages."""
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    node_modules = Path(temp_project_dir) / 'node_modules'
+    installed = {
+        'left-pad': '1.3.0',
+        'lodash': '4.17.21',
+        '@scope/package': '2.0.0',
+        '@other/left-pad': '1.3.0',
+    }
+    for package_name, version in installed.items():
+        package_dir = node_modules / package_name
+        package_dir.mkdir(parents=True)
+        (package_dir / 'package.json').write_text(json.dumps({'name': package_name, 'version': version}))
+
+    findings = adapter._scan_node_modules(node_modules)
+
+    assert {(f.package_name, f.version) for f in findings} == {('left-pad', '1.3.0'), ('@scope/package', '2.0.0')}
+    assert all(f.finding_type == 'installed' for f in findings)
+
+
 def test_invalid_json_handling(temp_project_dir, threat_db, capsys):
     """Test handling of invalid JSON files."""
     adapter = NpmAdapter(threat_db, Path(temp_project_dir))
@@ -305,6 +658,31 @@ def test_invalid_json_handling(temp_project_dir, threat_db, capsys):
     assert len(findings) == 0
 
 
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_json_parser_fallback(temp_project_dir, threat_db, capsys, monkeypatch, use_orjson):
+    """Test that stdlib json and orjson give the same findings and warnings."""
+    from package_scan.adapters import npm_adapter
+
+    if use_orjson and npm_adapter.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(npm_adapter, 'orjson', None)
+
+    adapter = NpmAdapter(threat_db, Path(temp_project_dir))
+
+    with open(os.path.join(temp_project_dir, 'package.json'), 'w') as f:
+        json.dump({'dependencies': {'lodash': '4.17.20'}}, f)
+    with open(os.path.join(temp_project_dir, 'package-lock.json'), 'w') as f:
+        f.write('{invalid json')
+    # Force the full-document parse for the lockfile
+    monkeypatch.setattr(npm_adapter, 'ijson', None)
+
+    findings = adapter.scan_project(Path(temp_project_dir))
+
+    assert [f.package_name for f in findings] == ['lodash']
+    assert 'Invalid JSON' in capsys.readouterr().err
+
+
 def test_missing_package_json(temp_project_dir, threat_db):
     """Test scanning directory without package.json."""
     adapter = NpmAdapter(threat_db, Path(temp_project_dir))
@@ -1,15 +1,26 @@
 """Unit tests for ReportEngine."""
 
+import io
 import json
 import os
 import tempfile
 
+import click
 import pytest
 
+from package_scan.core import report_engine
 from package_scan.core.models import Finding
 from package_scan.core.report_engine import ReportEngine
 
 
+@pytest.fixture(autouse=True)
+def reset_path_prefix():
+    """Re-read SCAN_PATH_PREFIX for every test, since tests change it."""
+    report_engine._get_path_prefix.cache_clear()
+    yield
+    report_engine._get_path_prefix.cache_clear()
+
+
 @pytest.fixture
 def sample_findings():
     """Create sample findings for testing."""
@@ -129,6 +140,55 @@ def test_save_report(sample_findings):
             os.unlink(temp_path)
 
 
+def test_write_report_empty():
+    """Test streaming an empty report produces valid JSON."""
+    engine = ReportEngine()
+    stream = io.BytesIO()
+    engine.write_report(stream)
+
+    report = json.loads(stream.getvalue())
+    assert report['findings'] == []
+    assert report['total_findings'] == 0
+    assert list(report) == ['total_findings', 'threats', 'ecosystems', 'findings', 'summary']
+
+
+def test_json_fallback_matches_orjson(sample_findings, monkeypatch):
+    """Test the stdlib json fallback writes the same bytes as orjson."""
+    pytest.importorskip('orjson')
+    engine = ReportEngine()
+    engine.set_threats(['sha1-hulud'])
+    engine.add_findings(sample_findings)
+
+    fast = io.BytesIO()
+    engine.write_report(fast)
+
+    monkeypatch.setattr(report_engine, 'orjson', None)
+    fallback = io.BytesIO()
+    engine.write_report(fallback)
+
+    assert fast.getvalue() == fallback.getvalue()
+
+
+def test_write_report_escapes_non_ascii():
+    """Test non-ASCII values are written as \\u escapes, like json.dump's default."""
+    engine = ReportEngine()
+    engine.add_findings([Finding(
+        ecosystem='npm',
+        finding_type='manifest',
+        file_path='/tmp/café/package.json',
+        package_name='left-pad',
+        version='1.3.0',
+        match_type='exact',
+    )])
+
+    stream = io.BytesIO()
+    engine.write_report(stream)
+
+    assert stream.getvalue().isascii()
+    assert b'caf\\u00e9' in stream.getvalue()
+    assert json.loads(stream.getvalue())['findings'][0]['file_path'] == '/tmp/café/package.json'
+
+
 def test_save_report_with_relative_paths(sample_findings):
     """Test saving report with relative paths via environment variable."""
     # Set environment variable to trigger relative path conversion
@@ -166,6 +226,17 @@ def test_save_report_with_relative_paths(sample_findings):
             os.environ['SCAN_PATH_PREFIX'] = old_env
 
 
+def test_format_path_with_prefix(monkeypatch):
+    """Test path conversion with an absolute prefix and paths outside the scan dir."""
+    monkeypatch.setenv('SCAN_PATH_PREFIX', '/home/user/project')
+    engine = ReportEngine(scan_dir='/workspace')
+
+    assert engine._format_path('/workspace/app/pom.xml') == '/home/user/project/app/pom.xml'
+    # Repeated lookups are served from the cache with the same result
+    assert engine._format_path('/workspace/app/pom.xml') == '/home/user/project/app/pom.xml'
+    assert engine._format_path('/elsewhere/pom.xml') == '/elsewhere/pom.xml'
+
+
 def test_save_report_with_threats():
     """Test saving report with threat tracking."""
     engine = ReportEngine()
@@ -252,6 +323,19 @@ def test_print_report_with_findings(sample_findings, capsys):
     assert "django" in captured.out
 
 
+def test_print_report_color_follows_click_context(sample_findings, capsys):
+    """Test styling is skipped for redirected output unless color is forced."""
+    engine = ReportEngine()
+    engine.add_findings(sample_findings)
+
+    engine.print_report()
+    assert '\x1b[' not in capsys.readouterr().out
+
+    with click.Context(click.Command('scan'), color=True):
+        engine.print_report()
+    assert '\x1b[31m' in capsys.readouterr().out
+
+
 def test_unique_package_counting():
     """Test that unique package counting works correctly."""
     engine = ReportEngine()
@@ -332,3 +416,18 @@ def test_ecosystems_list():
     finally:
         if os.path.exists(temp_path):
             os.unlink(temp_path)
+
+
+def test_ecosystem_grouping_tracks_new_findings(sample_findings):
+    """Test grouped findings are refreshed after adding or clearing findings."""
+    engine = ReportEngine()
+    engine.add_findings(sample_findings[:1])
+    assert engine.get_ecosystems() == ['npm']
+
+    engine.add_findings(sample_findings[1:])
+    assert engine.get_ecosystems() == ['maven', 'npm', 'pip']
+    assert engine._generate_summary()['npm']['total'] == 2
+
+    engine.clear()
+    assert engine.get_ecosystems() == []
+    assert engine._generate_summary() == {}
@@ -1,6 +1,9 @@
+import io
+
 from click.testing import CliRunner
 
-from package_scan.cli import cli
+from package_scan.adapters.base import ProgressSpinner
+from package_scan.cli import auto_detect_ecosystems, cli, threat_db_cli
 
 
 def test_cli_help():
@@ -21,3 +24,91 @@ def test_list_ecosystems():
     assert "npm" in result.output
     assert "maven" in result.output
     assert "pip" in result.output
+
+
+def test_auto_detect_ecosystems(tmp_path):
+    """Test ecosystem auto-detection skips excluded and hidden directories."""
+    (tmp_path / 'package.json').write_text('{}')
+    (tmp_path / 'service').mkdir()
+    (tmp_path / 'service' / 'pom.xml').write_text('<project/>')
+    (tmp_path / 'node_modules' / 'dep').mkdir(parents=True)
+    (tmp_path / 'node_modules' / 'dep' / 'setup.py').write_text('')
+    (tmp_path / '.cache').mkdir()
+    (tmp_path / '.cache' / 'Gemfile').write_text('')
+
+    assert auto_detect_ecosystems(tmp_path) == ['maven', 'npm']
+
+
+def test_spinner_rate_limits_redraws(monkeypatch):
+    """Test that TTY spinner updates within the redraw interval are dropped."""
+    output = io.StringIO()
+    monkeypatch.setattr('sys.stdout', output)
+
+    spinner = ProgressSpinner()
+    spinner.is_tty = True
+
+    spinner.update("first")
+    spinner.update("second")
+    assert "first" in output.getvalue()
+    assert "second" not in output.getvalue()
+
+    spinner._last_redraw -= ProgressSpinner.MIN_REDRAW_INTERVAL
+    spinner.update("third")
+    assert "third" in output.getvalue()
+
+
+def test_spinner_skips_update_during_concurrent_redraw(monkeypatch):
+    """Test that an update arriving mid-redraw on another thread is dropped."""
+    output = io.StringIO()
+    monkeypatch.setattr('sys.stdout', output)
+
+    spinner = ProgressSpinner()
+    spinner.is_tty = True
+
+    with spinner._redraw_lock:
+        spinner.update("blocked")
+    assert output.getvalue() == ""
+
+    spinner.update("drawn")
+    assert "drawn" in output.getvalue()
+
+
+def test_version_is_resolved_lazily():
+    """Test that __version__ is still available as a package attribute."""
+    import package_scan
+
+    assert isinstance(package_scan.__version__, str)
+    assert package_scan.__version__
+
+
+def test_threat_db_info_file_csv(tmp_path):
+    """Test raw CSV export of a threat file skips comment and blank lines."""
+    csv_file = tmp_path / 'threat.csv'
+    csv_file.write_text(
+        '# Threat: example\n'
+        'ecosystem,name,version\n'
+        '\n'
+        'npm,left-pad,1.3.0  \n'
+        '# trailing comment\n'
+        'pip,requests,2.0.0\n'
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(threat_db_cli, ['info', '--file', str(csv_file), '--packages', '--csv'])
+
+    assert result.exit_code == 0
+    assert result.output == 'ecosystem,name,version\nnpm,left-pad,1.3.0\npip,requests,2.0.0\n'
+
+
+def test_threat_db_info_file_csv_chunks(tmp_path, monkeypatch):
+    """Test raw CSV export spanning several echo chunks keeps every line."""
+    monkeypatch.setattr('package_scan.cli.CSV_ECHO_CHUNK_LINES', 2)
+    rows = [f'npm,package{idx},1.0.{idx}' for idx in range(5)]
+    csv_file = tmp_path / 'threat.csv'
+    csv_file.write_text('ecosystem,name,version\n' + '\n'.join(rows) + '\n')
+
+    runner = CliRunner()
+    result = runner.invoke(threat_db_cli, ['info', '--file', str(csv_file), '--packages', '--csv'])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ['ecosystem,name,version'] + rows
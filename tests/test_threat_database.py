@@ -207,3 +207,158 @@ def test_case_sensitivity():
     finally:
         if os.path.exists(temp_path):
             os.unlink(temp_path)
+
+
+def test_iter_sorted_packages(temp_threats_dir):
+    """Test iterating packages in sorted order."""
+    with open(os.path.join(temp_threats_dir, 'threat3.csv'), 'w') as f:
+        f.write("ecosystem,name,version\n")
+        f.write("npm,package1,0.9.0\n")
+        f.write("npm,aaa,2.0.0\n")
+
+    db = ThreatDatabase(threats_dir=temp_threats_dir)
+    db.load_threats()
+
+    assert list(db.iter_sorted_packages('npm')) == [
+        ('aaa', ['2.0.0']),
+        ('package1', ['0.9.0', '1.0.0']),
+    ]
+    assert list(db.iter_sorted_packages('NPM')) == list(db.iter_sorted_packages('npm'))
+    assert list(db.iter_sorted_packages('gem')) == []
+
+
+def test_is_compromised(temp_threats_dir):
+    """Test exact version checks, including after loading more threats."""
+    db = ThreatDatabase(threats_dir=temp_threats_dir)
+    assert not db.is_compromised('npm', 'package1', '1.0.0')
+
+    db.load_threats(threat_names=['threat1'])
+    assert db.is_compromised('npm', 'package1', '1.0.0')
+    assert db.is_compromised('MAVEN', 'org.example:lib', '2.0.0')
+    assert not db.is_compromised('npm', 'package1', '2.0.0')
+    assert not db.is_compromised('pip', 'django', '3.0.0')
+
+    db.load_threats(threat_names=['threat2'])
+    assert db.is_compromised('pip', 'django', '3.0.0')
+
+
+def test_load_skips_incomplete_rows(tmp_path, capsys):
+    """Test short and empty-field rows are skipped without failing the file."""
+    csv_path = tmp_path / 'partial.csv'
+    csv_path.write_text(
+        "name,version,ecosystem\n"
+        "left-pad,1.3.0,npm\n"
+        "\n"
+        "short-row,1.0.0\n"
+        ",2.0.0,npm\n"
+    )
+
+    db = ThreatDatabase()
+    assert db.load_threats(csv_file=str(csv_path))
+    assert db.get_all_packages('npm') == {'left-pad': {'1.3.0'}}
+
+    err = capsys.readouterr().err
+    assert "Skipped 2 malformed row(s)" in err
+    assert "row 3 with missing field 'ecosystem'" in err
+    assert "row 4 with empty fields" in err
+
+
+def test_load_warnings_are_truncated(tmp_path, capsys):
+    """Test only the first few skipped rows are listed individually."""
+    csv_path = tmp_path / 'broken.csv'
+    csv_path.write_text("ecosystem,name,version\n" + "npm,,1.0.0\n" * 8)
+
+    db = ThreatDatabase()
+    db.load_threats(csv_file=str(csv_path))
+
+    err = capsys.readouterr().err
+    assert "Skipped 8 malformed row(s)" in err
+    assert err.count("with empty fields") == 5
+    assert "... and 3 more" in err
+
+
+def test_collect_stats_matches_compute_stats(temp_threats_dir):
+    """Test stats gathered during load match a standalone compute_stats pass."""
+    from pathlib import Path
+
+    from package_scan.core.threat_metadata import parse_threat_metadata
+
+    # Short rows, empty fields and duplicates are counted the same both ways
+    with open(os.path.join(temp_threats_dir, 'malformed.csv'), 'w') as f:
+        f.write("ecosystem,name,version\n")
+        f.write("npm,good,1.0.0\n")
+        f.write("npm,good,1.0.0\n")
+        f.write("npm,no-version,\n")
+        f.write("npm,short\n")
+        f.write("pip\n")
+        f.write(",no-ecosystem,1.0.0\n")
+        f.write("npm,,1.0.0\n")
+
+    db = ThreatDatabase(threats_dir=temp_threats_dir)
+    db.load_threats(collect_stats=True)
+    assert set(db.file_stats) == {'threat1', 'threat2', 'malformed'}
+    assert db.file_stats['malformed']['total_versions'] == 4
+
+    for threat_name, stats in db.file_stats.items():
+        metadata = parse_threat_metadata(Path(temp_threats_dir) / f"{threat_name}.csv")
+        metadata.compute_stats()
+        assert stats == metadata.stats
+
+    plain_db = ThreatDatabase(threats_dir=temp_threats_dir)
+    plain_db.load_threats()
+    assert plain_db.file_stats == {}
+
+
+def test_package_and_version_counts(temp_threats_dir):
+    """Test counts per ecosystem and overall, refreshed on each load."""
+    db = ThreatDatabase(threats_dir=temp_threats_dir)
+    db.load_threats(threat_names=['threat1'])
+    assert db.get_package_count() == 2
+    assert db.get_version_count('NPM') == 1
+    assert db.get_package_count('pip') == 0
+
+    db.load_threats(threat_names=['threat2'])
+    assert db.get_package_count() == 3
+    assert db.get_version_count() == 3
+    assert db.get_package_count('pip') == 1
+
+
+def test_load_threats_ecosystem_filter(temp_csv_file):
+    """Test only rows for the requested ecosystems are loaded."""
+    db = ThreatDatabase()
+    assert db.load_threats(csv_file=temp_csv_file, ecosystems=['NPM', 'pip'])
+
+    assert db.get_ecosystems() == {'npm', 'pip'}
+    assert db.get_compromised_versions('npm', 'left-pad') == {'1.3.0'}
+    assert db.get_compromised_versions('maven', 'org.springframework:spring-core') == set()
+
+
+def test_are_compromised(temp_csv_file):
+    """Test batch checks agree with is_compromised."""
+    db = ThreatDatabase()
+    packages = [
+        ('npm', 'left-pad', '1.3.0'),
+        ('NPM', 'left-pad', '1.3.1'),
+        ('NPM', 'left-pad', '1.3.0'),
+        ('pip', 'requests', '2.8.1'),
+        ('gem', 'rails', '1.0.0'),
+    ]
+    assert db.are_compromised(packages) == [False, False, False, False, False]
+
+    db.load_threats(csv_file=temp_csv_file)
+    assert db.are_compromised(packages) == [True, False, True, True, False]
+    assert db.are_compromised(packages) == [db.is_compromised(*package) for package in packages]
+
+
+def test_bind_ecosystem(temp_csv_file):
+    """Test ecosystem views agree with the database lookups."""
+    db = ThreatDatabase()
+    assert not db.bind_ecosystem('npm').is_compromised('left-pad', '1.3.0')
+
+    db.load_threats(csv_file=temp_csv_file)
+    npm = db.bind_ecosystem('NPM')
+    assert npm.is_compromised('left-pad', '1.3.0')
+    assert not npm.is_compromised('left-pad', '1.3.1')
+    assert not npm.is_compromised('requests', '2.8.1')
+    assert npm.get_compromised_versions('left-pad') == db.get_compromised_versions('npm', 'left-pad')
+    assert npm.get_compromised_versions('unknown') == set()
@@ -9,6 +9,7 @@ import pytest
 from package_scan.core.threat_metadata import (
     parse_threat_metadata,
     filter_csv_comments,
+    iter_csv_rows_without_comments,
     RECOMMENDED_FIELDS,
 )
 
@@ -154,6 +155,24 @@ class TestThreatMetadataParsing:
         assert len(metadata.metadata) == 0
         assert len(metadata.comment_lines) == 0
 
+    def test_compute_stats_skips_short_rows(self, tmp_path):
+        """Test that stats count complete rows and ignore truncated ones"""
+        csv_file = tmp_path / 'threat.csv'
+        csv_file.write_text(
+            "# Threat: example\n"
+            "version,name,ecosystem\n"
+            "1.0.0,left-pad,npm\n"
+            "2.0.0,left-pad,npm\n"
+            "1.0.0,requests\n"
+            "3.0.0,requests,pip\n"
+        )
+
+        metadata = parse_threat_metadata(csv_file)
+        metadata.compute_stats()
+
+        assert metadata.stats['total_versions'] == 3
+        assert metadata.stats['ecosystems'] == ['npm', 'pip']
+
 
 class TestFilterCSVComments:
     """Test CSV comment filtering"""
@@ -211,6 +230,22 @@ class TestFilterCSVComments:
         assert all(not line.startswith('#') for line in filtered)
         assert all(line.strip() for line in filtered)  # No empty lines
 
+    def test_iter_rows_plain_and_quoted(self, tmp_path):
+        """Test row iteration matches csv parsing with and without quotes"""
+        plain = tmp_path / 'plain.csv'
+        plain.write_text("\ufeff# Source: test\r\necosystem,name,version\r\n\r\nnpm,pkg1,1.0.0\r\n")
+        assert list(iter_csv_rows_without_comments(plain)) == [
+            ['ecosystem', 'name', 'version'],
+            ['npm', 'pkg1', '1.0.0'],
+        ]
+
+        quoted = tmp_path / 'quoted.csv'
+        quoted.write_text('ecosystem,name,version\nnpm,"pkg,1",1.0.0\n')
+        assert list(iter_csv_rows_without_comments(quoted)) == [
+            ['ecosystem', 'name', 'version'],
+            ['npm', 'pkg,1', '1.0.0'],
+        ]
+
 
 class TestRealThreatFiles:
     """Test metadata parsing on real threat files"""
@@ -10,7 +10,10 @@ from package_scan.core.threat_validator import (
     ThreatValidator,
     ValidationResult,
     validate_threat_file,
+    validate_threat_files,
     KNOWN_ECOSYSTEMS,
+    MAX_DUPLICATE_WARNINGS,
+    MAX_VALUE_PREVIEW,
 )
 
 
@@ -233,6 +236,19 @@ class TestThreatValidator:
         assert any('Duplicate entry' in msg for msg in warning_messages)
         assert sum('Duplicate entry' in msg for msg in warning_messages) == 2
 
+    def test_validate_many_duplicates_summarized(self, tmp_path):
+        """Test duplicate warnings are capped with one summary warning."""
+        csv_path = tmp_path / 'dupes.csv'
+        csv_path.write_text("ecosystem,name,version\n" + "npm,left-pad,1.3.0\n" * (MAX_DUPLICATE_WARNINGS + 6))
+
+        result = ThreatValidator().validate_file(csv_path)
+
+        assert result.is_valid
+        warning_messages = [warning.message for warning in result.warnings]
+        assert sum('Duplicate entry' in msg for msg in warning_messages) == MAX_DUPLICATE_WARNINGS
+        assert f"5 more duplicate entries not listed ({MAX_DUPLICATE_WARNINGS + 5} in total)" in warning_messages
+        assert result.stats['unique_entries'] == 1
+
     def test_validate_invalid_version(self, invalid_version_csv):
         """Test validation detects invalid version strings."""
         validator = ThreatValidator()
@@ -353,6 +369,21 @@ class TestValidateThreatFileFunction:
         assert 'WARNINGS' in captured.out
         assert 'Duplicate entry' in captured.out
 
+    def test_validate_threat_file_strictness_not_shared(self, unknown_ecosystem_csv, capsys):
+        """Test reused validators keep strict and non-strict runs apart."""
+        assert validate_threat_file(unknown_ecosystem_csv, strict=True) is False
+        assert validate_threat_file(unknown_ecosystem_csv, strict=False) is True
+        assert validate_threat_file(unknown_ecosystem_csv, strict=True) is False
+
+    def test_validate_threat_files(self, valid_modern_csv, invalid_headers_csv, capsys):
+        """Test batch validation passes only if every file does, printing in order."""
+        assert validate_threat_files([valid_modern_csv, valid_modern_csv], workers=2) is True
+        assert validate_threat_files([valid_modern_csv, invalid_headers_csv], workers=2) is False
+
+        captured = capsys.readouterr()
+        assert captured.out.count('VALIDATION PASSED') == 3
+        assert captured.out.index(invalid_headers_csv) > captured.out.rindex(valid_modern_csv)
+
 
 class TestRealThreatFiles:
     """Test validation against real threat database files."""
@@ -441,3 +472,35 @@ class TestEdgeCases:
         finally:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
+
+    def test_long_values_are_clipped(self, tmp_path):
+        """Test huge field values are shortened in messages and value previews."""
+        long_version = '1.0.' + '!' * 10000
+        csv_path = tmp_path / 'long.csv'
+        csv_path.write_text(f"ecosystem,name,version\nnpm,left-pad,{long_version}\n")
+
+        result = ThreatValidator().validate_file(csv_path)
+
+        warning = next(w for w in result.warnings if w.field == 'version')
+        assert warning.value == long_version[:MAX_VALUE_PREVIEW] + '…'
+        assert len(warning.message) < 200
+
+    def test_csv_with_short_row(self):
+        """Test fields missing from a short row are reported as empty."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("ecosystem,name,version\n")
+            f.write("npm,left-pad,1.3.0\n")
+            f.write("npm,lodash\n")
+            temp_path = f.name
+
+        try:
+            validator = ThreatValidator()
+            result = validator.validate_file(Path(temp_path))
+
+            assert not result.is_valid
+            assert [(e.line_number, e.field) for e in result.errors] == [(3, 'version')]
+            assert result.stats['total_rows'] == 2
+            assert result.stats['valid_rows'] == 1
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)